@@ -6,30 +6,62 @@ and other interest rate-related markets
 'edan' <- e(conomic) d(ata) an(alysis)
 """
 
-import edan.nipa
-import edan.cpi
-import edan.ces
-import edan.data
-import edan.plotting
+import importlib
 
-from edan.aggr import aggregate
 
-from edan.core.transformations import transform
+# submodules and objects are imported the first time they're accessed as
+#	attributes of `edan` (PEP 562), so that `import edan` doesn't load every
+#	table registry, pandas & matplotlib before any of it is needed. values
+#	are (module, attribute) pairs; an empty attribute means the module itself
+_lazy_imports = {
+	# modules
+	'nipa': ('edan.nipa', ''),
+	'cpi': ('edan.cpi', ''),
+	'ces': ('edan.ces', ''),
+	'data': ('edan.data', ''),
+	'plotting': ('edan.plotting', ''),
+
+	# aggregation & modifications
+	'aggregate': ('edan.aggr', 'aggregate'),
+	'transform': ('edan.core.transformations', 'transform'),
+
+	# counterfactuals & forecasts
+	'forecast': ('edan.scenarios.forecasts', 'forecast'),
+	'Forecast': ('edan.scenarios.forecasts', 'Forecast'),
+	'Forecaster': ('edan.scenarios.forecasts', 'Forecaster'),
+
+	# indices
+	'paasche': ('edan.indices', 'paasche'),
+	'laspeyres': ('edan.indices', 'laspeyres'),
+	'fisher': ('edan.indices', 'fisher'),
+	'tornqvist': ('edan.indices', 'tornqvist'),
+	'walsh': ('edan.indices', 'walsh'),
+	'geometric': ('edan.indices', 'geometric'),
+	'marshall_edgeworth': ('edan.indices', 'marshall_edgeworth'),
+	'carli': ('edan.indices', 'carli'),
+	'dutot': ('edan.indices', 'dutot'),
+	'jevons': ('edan.indices', 'jevons'),
+	'harmonic_mean': ('edan.indices', 'harmonic_mean'),
+	'cswd_index': ('edan.indices', 'cswd_index'),
+	'harmonic_ratios': ('edan.indices', 'harmonic_ratios')
+}
+
+def __getattr__(name: str):
+	try:
+		module_name, attr = _lazy_imports[name]
+	except KeyError:
+		raise AttributeError(f"module 'edan' has no attribute {repr(name)}") from None
+
+	obj = importlib.import_module(module_name)
+	if attr:
+		obj = getattr(obj, attr)
 
-from edan.scenarios.forecasts import (
-	forecast,
-	Forecast,
-	Forecaster
-)
+	# cache on the module so __getattr__ is only called on first access
+	globals()[name] = obj
+	return obj
 
-from edan.indices import (
-	paasche,
-	laspeyres,
-	fisher,
-	tornqvist,
-	walsh,
-	geometric
-)
+def __dir__():
+	return sorted(set(globals()) | set(_lazy_imports))
 
 
 
@@ -41,7 +73,8 @@ __all__ = [
 	'data',
 	'plotting',
 
-	# modifications
+	# aggregation & modifications
+	'aggregate',
 	'transform',
 
 	# counterfactuals & foreasts
@@ -62,5 +95,5 @@ __all__ = [
 	'jevons',
 	'harmonic_mean',
 	'cswd_index',
-	'harmonic_ratio'
+	'harmonic_ratios'
 ]
@@ -4,6 +4,11 @@
 
 from __future__ import annotations
 
+import importlib
+
+
+_object_setattr = object.__setattr__
+
 
 class CachedAccessor:
 	"""
@@ -16,23 +21,39 @@ class CachedAccessor:
 	----------
 	name : str
 		namespace that the property-like object will be accessed under, e.g. `df.foo`
-	accessor : cls
-		class with extension methods
+	accessor : cls | str
+		class with extension methods, or its dotted import path. a path defers
+		importing the accessor's module until the namespace is first used, which
+		keeps heavy dependencies like matplotlib out of `import edan`
 	"""
 
 	def __init__(self, name: str, accessor) -> None:
 		self._name = name
 		self._accessor = accessor
 
+	@property
+	def accessor(self):
+		""" the accessor class, imported on first use if given as a path """
+		accessor = self._accessor
+		if isinstance(accessor, str):
+			module, _, attr = accessor.rpartition('.')
+			accessor = getattr(importlib.import_module(module), attr)
+			self._accessor = accessor
+		return accessor
+
 	def __get__(self, obj, cls):
 		if obj is None:
 			#  accessing the attribute of the class
-			return self._accessor
-		accessor_obj = self._accessor(obj)
+			return self.accessor
+		accessor_obj = self.accessor(obj)
 
 		# replace the property with the accessor object. inspired by:
 		#	https://www.pydanny.com/cached-property.html
-		# we need to use object.__setattr__ because we might overwrite __setattr__
-		# elsewhere
-		object.__setattr__(obj, self._name, accessor_obj)
+		# when the class doesn't override __setattr__ the instance dict is written
+		#	to directly; otherwise we need to use object.__setattr__ to get
+		#	around the override
+		if type(obj).__setattr__ is _object_setattr:
+			obj.__dict__[self._name] = accessor_obj
+		else:
+			_object_setattr(obj, self._name, accessor_obj)
 		return accessor_obj
@@ -4,8 +4,6 @@ aggregating components into custom aggregates
 
 from __future__ import annotations
 
-from edan.utils.dtypes import iterable_not_string
-
 from edan.core.base import BaseComponent
 from edan.nipa.aggr import aggregate_nipa
 
@@ -51,49 +49,48 @@ def aggregate(
 	-------
 	Component
 	"""
-	if iterable_not_string(objs):
-		# ensure all components come from the same table
-		tables, sources = [], []
-		for obj in objs:
-			if not isinstance(obj, BaseComponent):
-				raise TypeError("every elements of must be a Component")
-			tables.append(obj.table)
-			sources.append(obj.source)
-
-		def all_equal(iterator):
-			iterator = iter(iterator)
-			try:
-				first = next(iterator)
-			except StopIteration:
-				return True
-			return all(first == x for x in iterator)
-
-		if not all_equal(tables):
+	# `objs` is collected into a list once, so generators aren't exhausted by
+	#	the validation below before aggregating
+	if isinstance(objs, str):
+		raise TypeError("`objs` must be an iterable of Components")
+	try:
+		components = list(objs)
+	except TypeError:
+		raise TypeError("`objs` must be an iterable of Components") from None
+
+	if not components:
+		raise ValueError("`objs` must contain at least one Component")
+
+	# ensure all components come from the same table & source, stopping at the
+	#	first mismatch
+	first = components[0]
+	if not isinstance(first, BaseComponent):
+		raise TypeError("every element of `objs` must be a Component")
+	table, source = first.table, first.source
+
+	for obj in components[1:]:
+		if not isinstance(obj, BaseComponent):
+			raise TypeError("every element of `objs` must be a Component")
+		if obj.table != table:
 			raise ValueError("can only aggregate Components from the same table")
-
-		if not all_equal(sources):
+		if obj.source != source:
 			raise ValueError("can only aggregate Components from the same source")
 
-		try:
-			table = tables[0]
-			aggr_func = table_aggregators[table]
-
-			return aggr_func(
-				objs=objs,
-				code=code,
-				level=level,
-				long_name=long_name,
-				short_name=short_name,
-				table=table
-			)
-
-		except KeyError:
-			raise NotImplementedError(
-				f"no aggregator function available for the {table} table"
-			)
-
-	else:
-		raise TypeError("`objs` must be an iterable of Components")
+	try:
+		aggr_func = table_aggregators[table]
+	except KeyError:
+		raise NotImplementedError(
+			f"no aggregator function available for the {table} table"
+		) from None
+
+	return aggr_func(
+		objs=components,
+		code=code,
+		level=level,
+		long_name=long_name,
+		short_name=short_name,
+		table=table
+	)
 
 
 table_aggregators = {
@@ -5,6 +5,12 @@ like structures that are common in edan
 
 from __future__ import annotations
 
+from itertools import islice
+from operator import attrgetter
+
+import numpy as np
+
+
 def construct_tree(
 	objs: Iterable,
 	level: str = 'level',
@@ -32,33 +38,33 @@ def construct_tree(
 	-------
 	the first obj in `objs`, with it's `subs` attribute filled
 	"""
-	def get_level(obj):
-		return obj.__getattribute__(level)
-
-	def get_lower(obj):
-		return obj.__getattribute__(lower)
+	get_level = attrgetter(level)
+	get_lower = attrgetter(lower)
 
+	# the levels of the objects in `stack` are tracked alongside it, so each
+	#	object's level is only looked up once
 	stack = [objs[0]]
-	for i in range(1, len(objs)):
+	levels = [get_level(objs[0])]
 
-		obj = objs[i]
-		sup = stack[-1]
+	# bound once, outside the loop
+	stack_pop, stack_append = stack.pop, stack.append
+	levels_pop, levels_append = levels.pop, levels.append
 
-		if get_level(obj) > get_level(sup):
-			lower_objs = get_lower(sup)
-			lower_objs.append(obj)
-			stack.append(obj)
+	for obj in islice(objs, 1, None):
 
-		else:
-			top = stack.pop()
-			while get_level(obj) <= get_level(top):
-				top = stack.pop()
+		obj_level = get_level(obj)
 
-			lower_objs = get_lower(top)
-			lower_objs.append(obj)
+		if obj_level <= levels[-1]:
+			# climb back up to the first object that `obj` aggregates into
+			stack_pop()
+			levels_pop()
+			while obj_level <= levels[-1]:
+				stack_pop()
+				levels_pop()
 
-			stack.append(top)
-			stack.append(obj)
+		get_lower(stack[-1]).append(obj)
+		stack_append(obj)
+		levels_append(obj_level)
 
 	return stack[0]
 
@@ -87,24 +93,17 @@ def construct_forest(
 	-------
 	a list of top-level aggregates
 	"""
-	def get_level(obj):
-		return obj.__getattribute__(level)
+	get_level = attrgetter(level)
 
-	# iterate through collection to first record where breakpoints are
-	breaks = []
-	for idx, obj in enumerate(objs):
-		if not get_level(obj):
-			breaks.append(idx)
+	# record where the breakpoints (the top-level aggregates) are
+	n_objs = len(objs)
+	levels = np.fromiter(map(get_level, objs), dtype=np.int64, count=n_objs)
+	breaks = np.flatnonzero(levels == 0).tolist()
 
 	# after locating the partition point for the objects, sort
 	forest = []
-	for idx, brk in enumerate(breaks):
-		try:
-			section = objs[slice(brk, breaks[idx+1])]
-		except IndexError:
-			section = objs[slice(brk, len(objs))]
-
-		tree = construct_tree(section, level, lower)
+	for start, stop in zip(breaks, breaks[1:] + [n_objs]):
+		tree = construct_tree(objs[start:stop], level, lower)
 		forest.append(tree)
 
 	return forest
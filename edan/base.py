@@ -5,15 +5,28 @@ abstract base class for edan objects
 from copy import deepcopy
 
 
+# immutable types whose instances can be shared by a copy as-is
+_ATOMIC_TYPES = frozenset({
+	str, int, float, bool, complex, bytes, type(None)
+})
+
+
 class EdanObject(object):
 
 	def __deepcopy__(self, memo):
-		"""create copies of edan custom classes"""
+		"""
+		create copies of edan custom classes. immutable attributes are shared
+		with the copy rather than sent through `deepcopy`
+		"""
 		cls = self.__class__
 		result = cls.__new__(cls)
 		memo[id(self)] = result
 
+		copied = result.__dict__
 		for k, v in self.__dict__.items():
-			setattr(result, k, deepcopy(v, memo))
+			if type(v) in _ATOMIC_TYPES:
+				copied[k] = v
+			else:
+				copied[k] = deepcopy(v, memo)
 
 		return result
@@ -3,4 +3,10 @@ from edan.ces.core import (
 	CESComponent
 )
 
-from edan.ces.api import CESTable
+
+def __getattr__(name: str):
+	# `CESTable` is built on first access; see `edan.ces.api`
+	if name == 'CESTable':
+		from edan.ces.api import CESTable
+		return CESTable
+	raise AttributeError(f"module {repr(__name__)} has no attribute {repr(name)}")
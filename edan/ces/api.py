@@ -1,17 +1,25 @@
 """
-module that prepares the CES employment table
+module that prepares the CES employment table. the table is only built the
+first time `CESTable` is accessed, so importing `edan.ces` doesn't construct
+the CES component tree until it's needed
 """
 
+import functools
+
 from edan.algos import construct_forest
 from edan.core.tables import Table
 from edan.core.register import registry
 
 from edan.ces.core import CESComponent
 
-flat_ces = []
-for entry in registry.by_table('ces'):
-	flat_ces.append(CESComponent.from_registry(entry))
 
-construct_forest(flat_ces, level='level', lower='subs')
+@functools.lru_cache(maxsize=None)
+def _build_ces_table():
+	flat_ces = CESComponent.from_registry_many(registry.by_table('ces'))
+	construct_forest(flat_ces, level='level', lower='subs')
+	return Table(flat_ces, 'CES')
 
-CESTable = Table(flat_ces, 'CES')
+def __getattr__(name: str):
+	if name == 'CESTable':
+		return _build_ces_table()
+	raise AttributeError(f"module {repr(__name__)} has no attribute {repr(name)}")
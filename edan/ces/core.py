@@ -14,13 +14,6 @@ from edan.core.transformations import TransformationAccessor
 
 class CESSeries(Series):
 
-	def __init__(
-		self,
-		code: str, mtype: str, comp: Component,
-		*args, **kwargs
-	):
-		super().__init__(code, mtype=mtype, source=comp.source, comp=comp)
-
 	# add accessor for functions of data
 	transform = CachedAccessor('transform', TransformationAccessor)
 
@@ -4,6 +4,10 @@ shared base container objects for macroeconomic aggregate data
 
 from __future__ import annotations
 
+import sys
+
+import numpy as np
+
 import edan.delims as dlm
 
 from edan.errors import MeasureTypeError
@@ -14,7 +18,128 @@ from edan.core.series import Series
 from edan.core.disaggregate import Disaggregator
 
 from edan.accessors import CachedAccessor
-from edan.plotting.core import ComponentPlotAccessor
+
+
+class _TreeVersion(object):
+	"""
+	version counter of an aggregation tree. every Component starts with its own,
+	and when it's placed below another Component the two counters are joined by
+	pointing one at the other; following `merged` from any Component's counter
+	leads to the one counter of its whole tree. caches of walks of a tree record
+	that counter & its value, and are rebuilt when either has changed
+	"""
+	__slots__ = ('value', 'merged')
+
+	def __init__(self):
+		self.value = 0
+		self.merged = None
+
+	def root(self):
+		"""the counter of the whole tree this counter belongs to"""
+		root = self
+		while root.merged is not None:
+			root = root.merged
+
+		# point every counter along the way directly at the root, so later
+		#	lookups are shorter
+		node = self
+		while node is not root:
+			node.merged, node = root, node.merged
+
+		return root
+
+	def join(self, other: _TreeVersion):
+		"""join the tree of `other` to this one's"""
+		root, other_root = self.root(), other.root()
+		if root is not other_root:
+			other_root.merged = root
+
+	def bump(self):
+		self.root().value += 1
+
+
+class Subcomponents(list):
+	"""
+	list of the Components immediately below another one in an aggregation tree.
+	Components cache the walks of the trees below them, so every change to the
+	list bumps the version of the tree it's in, and the Components added to it
+	join that tree. appending to the subcomponents of a descendant therefore
+	invalidates the caches of every Component above it, but not those of
+	Components in other trees
+	"""
+
+	def __init__(self, tree: _TreeVersion, comps: Iterable[Component] = ()):
+		super().__init__(comps)
+		self._tree = tree
+		for comp in self:
+			tree.join(comp._tree)
+
+	def __reduce_ex__(self, protocol):
+		# copies & pickles are rebuilt through `__init__`, so the copied
+		#	Components join the copied tree
+		return (self.__class__, (self._tree, list(self)))
+
+	def _changed(self, added: Iterable[Component] = ()):
+		tree = self._tree
+		for comp in added:
+			tree.join(comp._tree)
+		tree.bump()
+
+	def append(self, comp):
+		super().append(comp)
+		self._changed((comp,))
+
+	def extend(self, comps):
+		comps = list(comps)
+		super().extend(comps)
+		self._changed(comps)
+
+	def insert(self, index, comp):
+		super().insert(index, comp)
+		self._changed((comp,))
+
+	def remove(self, comp):
+		super().remove(comp)
+		self._changed()
+
+	def pop(self, index=-1):
+		comp = super().pop(index)
+		self._changed()
+		return comp
+
+	def clear(self):
+		super().clear()
+		self._changed()
+
+	def sort(self, *args, **kwargs):
+		super().sort(*args, **kwargs)
+		self._changed()
+
+	def reverse(self):
+		super().reverse()
+		self._changed()
+
+	def __setitem__(self, key, value):
+		if isinstance(key, slice):
+			value = list(value)
+			added = value
+		else:
+			added = (value,)
+		super().__setitem__(key, value)
+		self._changed(added)
+
+	def __delitem__(self, key):
+		super().__delitem__(key)
+		self._changed()
+
+	def __iadd__(self, comps):
+		self.extend(comps)
+		return self
+
+	def __imul__(self, n):
+		super().__imul__(n)
+		self._changed()
+		return self
 
 
 class Component(BaseComponent):
@@ -38,30 +163,48 @@ class Component(BaseComponent):
 		table: str = '',
 		**codes
 	):
-		# initialize CompoundStorage class with attribute names that hold data
-		super().__init__(fields=self.mtypes)
+		self._init_state()
 
 		# unique edan code that identifies this Component. the edan codes
 		#	corresponding to mtypes (real & nominal level, price index, etc)
 		#	are assumed to be passed as keywords
-		self.code = code
+		#	codes, source & table names repeat heavily across a table, so they're
+		#	interned to share memory and speed up comparisons
+		self.code = sys.intern(code)
+		self._is_less = self._code_is_less(code)
 		for mtype in self.mtypes:
 			try:
-				setattr(self, f"{mtype}_code", codes[mtype])
+				setattr(self, f"{mtype}_code", sys.intern(codes[mtype]))
 			except KeyError:
 				pass
 
 		# attributes about relations to other Components
 		self.level = level
-		self.subs = []
 
 		# display names source api
 		self.long_name = long_name
 		self.short_name = short_name
 
 		# source api and economic table this component belongs to
-		self.source = source
-		self.table = table
+		self.source = sys.intern(source)
+		self.table = sys.intern(table)
+
+	def _init_state(self):
+		"""
+		set up the state of a Component that doesn't come from its registry
+		entry, i.e. its data fields, empty subcomponents, and lazily-built caches.
+		both `__init__` and `from_registry_many` start from this, so attributes
+		added here are never missing from Components built in bulk
+		"""
+		# initialize CompoundStorage class with attribute names that hold data
+		super().__init__(fields=self.mtypes)
+
+		# version counter of the tree this Component is in
+		self._tree = _TreeVersion()
+		self.subs = []
+
+		# Series of each mtype, constructed on first access in `__getattr__`
+		self._series_cache = {}
 
 	def __getitem__(self, key: str):
 		if self.elemental:
@@ -70,20 +213,18 @@ class Component(BaseComponent):
 		if not isinstance(key, str):
 			raise TypeError(f"'key' must be a string")
 
-		subs = [s.code for s in self.subs]
+		subs = self._subs_by_code()
 		try:
 			# assume `key` is the entire code of a subcomponent
-			idx = subs.index(key)
-			return self.subs[idx]
+			return subs[key]
 
-		except ValueError:
+		except KeyError:
 			# `key` is relative to the code of this component
 
 			full_key = dlm.concat_codes(self.code, key)
 			try:
-				idx = subs.index(full_key)
-				return self.subs[idx]
-			except ValueError:
+				return subs[full_key]
+			except KeyError:
 				raise KeyError(
 					f"{repr(key)} does not match a subcomponent of {repr(self)}"
 				) from None
@@ -98,30 +239,62 @@ class Component(BaseComponent):
 		if it's not, `__getattr__` will be called.
 		"""
 		if attr in self.mtypes:
-			code = f"{attr}_code"
-
+			# Series that have already been constructed are kept in a dict, so
+			#	repeated access skips the code lookup & construction
+			cache = self._series_cache
 			try:
-				series_code = self.__getattribute__(code)
-				hidden_series_name = f"_{attr}"
-
-				try:
-					return self.__getattribute__(hidden_series_name)
-				except AttributeError:
-					series_code = self.__getattribute__(code)
-					series = self._series_obj(
-						code=series_code,
-						mtype=attr,
-						comp=self
-					)
-
-					setattr(self, hidden_series_name, series)
-					return series
+				return cache[attr]
+			except KeyError:
+				pass
 
+			try:
+				series_code = self.__getattribute__(f"{attr}_code")
 			except AttributeError:
-				raise MeasureTypeError(measure=attr, comp=self)
+				raise MeasureTypeError(measure=attr, comp=self) from None
+
+			series = self._series_obj(code=series_code, mtype=attr, comp=self)
+			cache[attr] = series
+			return series
 
 		raise AttributeError(f"Component class does not have {attr} attribute")
 
+	@staticmethod
+	def load_series(comps: Iterable[Component], mtype: str):
+		"""
+		construct the Series of `mtype` of each of `comps` that hasn't been
+		constructed yet, and store it like `__getattr__` does. the data of all of
+		them is retrieved together with `Series.bulk`, rather than one series at
+		a time. Components without a code for `mtype` are skipped, so accessing
+		that mtype still raises a MeasureTypeError
+
+		Parameters
+		----------
+		comps : Iterable[Component]
+			the Components whose Series are constructed
+		mtype : str
+			the mtype of the Series to construct
+		"""
+		attr = f"{mtype}_code"
+
+		# {Series class: [(series_code, Component), ...]}
+		groups = {}
+		for comp in comps:
+			if (mtype not in comp.mtypes) or (mtype in comp._series_cache):
+				continue
+
+			try:
+				series_code = comp.__getattribute__(attr)
+			except AttributeError:
+				continue
+
+			groups.setdefault(comp._series_obj, []).append((series_code, comp))
+
+		for series_obj, group in groups.items():
+			codes, owners = zip(*group)
+			constructed = series_obj.bulk(codes, mtype=mtype, comps=owners)
+			for comp, series in zip(owners, constructed):
+				comp._series_cache[mtype] = series
+
 
 	def disaggregate(
 		self,
@@ -167,20 +340,97 @@ class Component(BaseComponent):
 				return '~' not in rel
 			else:
 				return False
-		else:
-			code = dlm.EdanCode(self.code)
-			try:
-				last_delim = code.delims[-1]
-				if last_delim == '~':
-					return True
-				return False
-			except IndexError:
-				return False
+		return self._is_less
+
+	@staticmethod
+	def _code_is_less(code: str):
+		"""
+		the no-`rel` case of `is_less` only depends on the delimiter preceding
+		the last id in `code`, so it's computed once when the Component is made
+		"""
+		delims = dlm.EdanCode(code).delims
+		return bool(delims) and (delims[-1] == '~')
 
 	def __repr__(self):
 		klass = self.__class__.__name__
 		return f"{klass}({self.code}, {self.level})"
 
+	@property
+	def subs(self):
+		"""the Components immediately below this one in the aggregation tree"""
+		return self._subs
+
+	@subs.setter
+	def subs(self, subs):
+		# the Components above this one may have cached a walk through its
+		#	previous subcomponents
+		self._subs = Subcomponents(self._tree, subs)
+		self._tree.bump()
+
+		# each cache is a 2-tuple of the `_tree_stamp` it was built at and the
+		#	cached value
+		self._subs_index = None
+		self._subtree_arrays = None
+		self._flat = None
+
+	def _tree_stamp(self):
+		"""
+		2-tuple of the version counter of this Component's tree & its value.
+		caches of walks through the tree are valid while this is unchanged
+		"""
+		root = self._tree.root()
+		return root, root.value
+
+	def _subs_by_code(self):
+		"""
+		mapping of {code: subcomponent} of the immediate subcomponents. it's
+		built lazily, and rebuilt if any subcomponents have changed since
+		"""
+		version = self._tree_stamp()
+		cache = self._subs_index
+		if (cache is None) or (cache[0] != version):
+			cache = self._subs_index = (version, {s.code: s for s in self._subs})
+		return cache[1]
+
+	def _subtree(self):
+		"""
+		every Component below this one in the aggregation tree, in depth-first
+		order (the order they appear in a Table), alongside arrays of their levels
+		and whether they're elemental. storing those attributes contiguously lets
+		selections by level be done with a single vectorized comparison instead
+		of a recursive walk of the tree. built lazily, and rebuilt if the
+		subcomponents of any Component in the tree have changed since
+		"""
+		version = self._tree_stamp()
+		cache = self._subtree_arrays
+		if (cache is None) or (cache[0] != version):
+			comps = []
+			stack = list(reversed(self._subs))
+			while stack:
+				comp = stack.pop()
+				comps.append(comp)
+				stack.extend(reversed(comp.subs))
+
+			n = len(comps)
+			levels = np.fromiter((c.level for c in comps), dtype=np.int64, count=n)
+			elemental = np.fromiter((not c.subs for c in comps), dtype=bool, count=n)
+
+			cache = self._subtree_arrays = (version, (comps, levels, elemental))
+		return cache[1]
+
+	def _flat_index(self):
+		"""
+		mapping of {code: subcomponent} for every Component below this one in the
+		aggregation tree, so lookups by absolute code are a single dict probe.
+		built lazily from, and rebuilt alongside, the `_subtree` arrays
+		"""
+		version = self._tree_stamp()
+		cache = self._flat
+		if (cache is None) or (cache[0] != version):
+			comps, _, _ = self._subtree()
+			cache = self._flat = (version, {c.code: c for c in comps})
+		return cache[1]
+
 	@property
 	def default_mtype(self):
 		"""return the Series object representing the default mtype"""
@@ -215,8 +465,54 @@ class Component(BaseComponent):
 			**mtypes
 		)
 
+	@classmethod
+	def from_registry_many(cls, dcts: Iterable[dict]):
+		"""
+		build a list of Components from registry entries. equivalent to calling
+		`from_registry` on each entry, but the instances' attributes from the
+		registry are written in a single update of their `__dict__` rather than
+		through `__init__`
+
+		Parameters
+		----------
+		dcts : Iterable[dict]
+			registry entries of Components of this class
+
+		Returns
+		-------
+		list of Component
+		"""
+		new = object.__new__
+		intern = sys.intern
+		mtypes = cls.mtypes
+		mtype_codes = [(g, f"{g}_code") for g in mtypes]
+
+		comps = []
+		for dct in dcts:
+			code = intern(dct['code'])
+			state = {
+				'code': code,
+				'_is_less': cls._code_is_less(code),
+				'level': dct['__level__'],
+				'long_name': dct['long_name'],
+				'short_name': dct['short_name'],
+				'source': intern(dct['source']),
+				'table': intern(dct['__table__'])
+			}
+			for g, attr in mtype_codes:
+				mtype_code = dct.get(g)
+				if mtype_code:
+					state[attr] = intern(mtype_code)
+
+			comp = new(cls)
+			comp._init_state()
+			comp.__dict__.update(state)
+			comps.append(comp)
+
+		return comps
+
 	# add accessor for plotting
-	plot = CachedAccessor('plot', ComponentPlotAccessor)
+	plot = CachedAccessor('plot', 'edan.plotting.core.ComponentPlotAccessor')
 
 
 class FlowComponent(Component):
@@ -4,6 +4,8 @@ selecting subcomponents & disaggregated series of Component objects
 
 from __future__ import annotations
 
+import numpy as np
+
 from edan.delims import (
 	concat_codes,
 	contains
@@ -14,15 +16,20 @@ from edan.utils.dtypes import iterable_not_string
 
 def recursive_subcomponent(comp: Component, target: str):
 	"""
-	recursively search for subcomponent with code `target`
+	search down the subcomponent tree for the subcomponent with code `target`.
+	at each level only the first branch whose code contains `target` is followed
 	"""
+	while comp is not None:
+		if comp.code == target:
+			return comp
 
-	if comp.code == target:
-		return comp
-
-	for sub in comp.subs:
-		if contains(sub.code, target):
-			return recursive_subcomponent(sub, target)
+		subs, comp = comp.subs, None
+		for sub in subs:
+			if sub.code == target:
+				return sub
+			if contains(sub.code, target):
+				comp = sub
+				break
 
 
 def collect_elemental(comp: Component):
@@ -33,17 +40,8 @@ def collect_elemental(comp: Component):
 	if comp.elemental:
 		return []
 
-	elements = []
-	def _disagg_to_elements(obj):
-		if obj.elemental:
-			elements.append(obj)
-		else:
-			for sub in obj.subs:
-				_disagg_to_elements(sub)
-	for sub in comp.subs:
-		_disagg_to_elements(sub)
-
-	return elements
+	comps, _, elemental = comp._subtree()
+	return [comps[i] for i in np.flatnonzero(elemental)]
 
 
 def collect_all_subcomponents(comp: Component):
@@ -54,17 +52,29 @@ def collect_all_subcomponents(comp: Component):
 	if comp.elemental:
 		return []
 
-	subcomponents = []
-	def _disagg_all(obj):
-		if obj.elemental:
-			pass
-		else:
-			for sub in obj.subs:
-				subcomponents.append(sub)
-				_disagg_all(sub)
+	comps, _, _ = comp._subtree()
+	return list(comps)
 
-	_disagg_all(comp)
-	return subcomponents
+
+def level_indices(levels: np.ndarray, elemental: np.ndarray, level: int):
+	"""
+	positions of the subcomponents at `level`, and of the elemental ones that
+	sit above it, in the flattened subtree arrays of a Component
+
+	Parameters
+	----------
+	levels : np.ndarray
+		integer array of subcomponent levels
+	elemental : np.ndarray
+		boolean array marking elemental subcomponents
+	level : int
+		the absolute level to disaggregate to
+
+	Returns
+	-------
+	np.ndarray
+	"""
+	return np.flatnonzero((levels == level) | ((levels < level) & elemental))
 
 
 class Disaggregator(object):
@@ -103,31 +113,7 @@ class Disaggregator(object):
 		if subcomponents:
 
 			if iterable_not_string(subcomponents):
-
-				for code in subcomponents:
-					# outrageously un-pythonic but can't be bothered to workaround yet
-					not_sub = True
-
-					# concatenate later ids if `code` isn't an absolute edan code
-					abs_code = concat_codes(component.code, code)
-
-					for sub in component.subs:
-
-						if sub.code == abs_code:
-							# `subcomponents` references an immediate subcomponent
-							not_sub = False
-							self.disaggregates.append(sub)
-
-						elif contains(sub.code, abs_code):
-							# references a subcomponent further down
-							comp = recursive_subcomponent(sub, abs_code)
-							not_sub = False
-							self.disaggregates.append(comp)
-
-					if not_sub:
-						raise KeyError(
-							f"{code} is not a subcomponent of {component.code}"
-						)
+				self.disaggregates = [self._lookup(code) for code in subcomponents]
 
 			elif isinstance(subcomponents, str):
 
@@ -138,24 +124,7 @@ class Disaggregator(object):
 					self.disaggregates = collect_elemental(component)
 
 				else:
-					not_sub = True
-					abs_code = concat_codes(component.code, subcomponents)
-
-					for sub in component.subs:
-
-						if sub.code == abs_code:
-							not_sub = False
-							self.disaggregates.append(sub)
-
-						elif contains(sub.code, abs_code):
-							comp = recursive_subcomponent(sub, abs_code)
-							not_sub = False
-							self.disaggregates.append(comp)
-
-					if not_sub:
-						raise KeyError(
-							f"{subcomponents} is not a subcomponent of {component.code}"
-						)
+					self.disaggregates = [self._lookup(subcomponents)]
 
 			elif isinstance(subcomponents, bool):
 
@@ -168,21 +137,27 @@ class Disaggregator(object):
 
 		elif level:
 			abs_level = level + component.level
-			self.recursive_level(component, abs_level)
+
+			comps, levels, elemental = component._subtree()
+			idx = level_indices(levels, elemental, abs_level)
+			self.disaggregates = [comps[i] for i in idx]
 
 		elif subcomponents == '':
 			self.disaggregates = component.subs
 
-	def recursive_level(self, comp: Component, level: int):
-		if comp.level < level:
-			if comp.elemental:
-				self.disaggregates.append(comp)
-			else:
-				for sub in comp.subs:
-					self.recursive_level(sub, level)
-
-		elif comp.level == level:
-			self.disaggregates.append(comp)
+	def _lookup(self, code: str):
+		"""
+		find the subcomponent with the (relative or absolute) `edan` code `code`
+		anywhere below `self.component`
+		"""
+		# concatenate later ids if `code` isn't an absolute edan code
+		abs_code = concat_codes(self.component.code, code)
+		try:
+			return self.component._flat_index()[abs_code]
+		except KeyError:
+			raise KeyError(
+				f"{code} is not a subcomponent of {self.component.code}"
+			) from None
 
 	def __iter__(self):
 		for sub in self.disaggregates:
@@ -4,37 +4,57 @@ module for registering & saving Components
 
 from __future__ import annotations
 
-import json
+import functools
+import os
 import pathlib
 
+from edan.utils.jsonio import load_json
+
 # create registry based on JSON in edan/core/
 registry_filename = '.registry.json'
 registry_file = pathlib.Path(__file__).parent / registry_filename
 
 
+@functools.lru_cache(maxsize=None)
+def _load_registry(path: str, mtime: int):
+	"""
+	parse the registry JSON at `path` into a dict of entries keyed by their
+	series code. `mtime` is part of the cache key, so an edit to the registry
+	file forces a re-read
+	"""
+	return {d['code']: d for d in load_json(path)}
+
+
 class ComponentRegistry(object):
+	__slots__ = ('registry', '_by_concept', '_by_table', '_by_ctype')
 
 	reg_file = registry_file
 
 	def __init__(self):
 
-		with open(self.reg_file, 'r') as reg_list:
-			# list of dict with series codes & subcomponents
-			json_list = json.load(reg_list)
+		# dict of series codes to dicts of attributes & subcomponents
+		path = os.fspath(self.reg_file)
+		self.registry = _load_registry(path, os.stat(path).st_mtime_ns)
 
-		self.registry = {d['code']: d for d in json_list}
+		# entries grouped by concept, table & ctype, in registry order, so the
+		#	`by_*` lookups don't scan the whole registry
+		self._by_concept, self._by_table, self._by_ctype = {}, {}, {}
+		for e in self.registry.values():
+			self._by_concept.setdefault(e.get('__concept__'), []).append(e)
+			self._by_table.setdefault(e.get('__table__'), []).append(e)
+			self._by_ctype.setdefault(e.get('__ctype__'), []).append(e)
 
 	def __getitem__(self, key):
 		return self.registry[key]
 
 	def by_concept(self, concept: str):
-		return (e for e in self.registry.values() if e['__concept__'] == concept)
+		return iter(self._by_concept.get(concept, ()))
 
 	def by_table(self, table: str):
-		return (e for e in self.registry.values() if e['__table__'] == table)
+		return iter(self._by_table.get(table, ()))
 
 	def by_ctype(self, ctype: str):
-		return (e for e in self.registry.values() if e['__ctype__'] == ctype)
+		return iter(self._by_ctype.get(ctype, ()))
 
 
 registry = ComponentRegistry()
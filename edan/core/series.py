@@ -18,17 +18,21 @@ class Series(BaseSeries):
 		mtype: str = '',
 		data: pd.Series = None,
 		meta: pd.Series = None,
-		comp: Component = None
+		comp: Component = None,
+		source: str = ''
 	):
 		if (data is not None) or (meta is not None):
 			if data is None:
-				data = pd.Series()
+				data = pd.Series(dtype=object)
 			elif meta is None:
-				meta = pd.Series()
+				meta = pd.Series(dtype=object)
 		else:
 			# if no data or meta is provided, assume data needs to be retrieved
-			#	based on value of `code`
-			data, meta = retriever.retrieve(code, source=comp.source)
+			#	based on value of `code`, from the source of the Component if
+			#	one isn't given
+			if (not source) and (comp is not None):
+				source = comp.source
+			data, meta = retriever.retrieve(code, source=source)
 
 		self.code = code
 		self.data = data
@@ -42,6 +46,90 @@ class Series(BaseSeries):
 		else:
 			self.long_name, self.short_name = '', ''
 
+	@classmethod
+	def bulk(
+		cls,
+		codes: Iterable[str],
+		mtype: str = '',
+		source: str = '',
+		comps: Iterable[Component] = None
+	):
+		"""
+		construct a Series for each of `codes`, retrieving the data of all of them
+		with a single call to the retriever for each source. series already stored
+		in the data warehouse are then read from each parquet file once, instead
+		of once per Series
+
+		Parameters
+		----------
+		codes : Iterable[str]
+			the codes of the series to construct
+		mtype : str ( = '' )
+			the mtype of every series
+		source : str ( = '' )
+			the source api that hosts the series' data. if it's not given, the
+			source of each series' Component is used, like `__init__` does
+		comps : Iterable[Component] ( = None )
+			the Components each series belongs to, in the same order as `codes`
+
+		Returns
+		-------
+		list of Series
+		"""
+		codes = list(codes)
+		comps = [None]*len(codes) if comps is None else list(comps)
+
+		# {source: [position, ...]} of the codes retrieved from each source
+		by_source = {}
+		for i, comp in enumerate(comps):
+			src = source
+			if (not src) and (comp is not None):
+				src = comp.source
+			by_source.setdefault(src, []).append(i)
+
+		retrieved = [None]*len(codes)
+		for src, positions in by_source.items():
+			group = retriever.retrieve_many([codes[i] for i in positions], source=src)
+			for i, info in zip(positions, group):
+				retrieved[i] = info
+
+		series, seen = [], set()
+		for code, (data, meta), comp in zip(codes, retrieved, comps):
+			# repeated codes are retrieved once, but each Series gets its own data
+			if id(data) in seen:
+				data, meta = data.copy(), meta.copy()
+			seen.add(id(data))
+
+			series.append(
+				cls(code=code, mtype=mtype, data=data, meta=meta, comp=comp)
+			)
+
+		return series
+
+	@property
+	def data(self):
+		"""
+		the pandas object holding the data of the series. it's handed out as-is,
+		so callers can modify it in place; every access therefore counts as a
+		possible change & bumps `data_version`
+		"""
+		self._data_version += 1
+		return self._data
+
+	@data.setter
+	def data(self, data):
+		self._data = data
+		self._data_version = getattr(self, '_data_version', 0) + 1
+
+	@property
+	def data_version(self):
+		"""
+		counter that's bumped whenever the data of the series is replaced or
+		handed out to be possibly modified. objects that cache calculations on
+		the data compare it to the version they were built at
+		"""
+		return self._data_version
+
 	def __repr__(self):
 		klass = self.__class__.__name__
 		return f"{klass}({self.code})"
@@ -6,42 +6,17 @@ mapping from series codes (the `edan` codes) to the Components themselves
 from __future__ import annotations
 
 import os
-import functools
-from copy import deepcopy
+import types
 
 from edan.utils.dtypes import iterable_not_string
 
 
-class TableIterator(object):
-	"""
-	iterator constructor for the Table class. we split the iterator and the
-	data container following mgilson's comment in the thread
-	https://stackoverflow.com/questions/21665485/how-to-make-a-custom-object-iterable
-	which in turn is apparently based on what Python does under the hood
-
-	iterating over a Table returns the names of the series in it
-	"""
-
-	def __init__(self, names: Iterable):
-		self.idx = 0
-		self.data = names
-
-	def __iter__(self):
-		return self
-
-	def __next__(self):
-		self.idx += 1
-		try:
-			return self.data[self.idx-1]
-		except IndexError:
-			self.idx = 0
-			raise StopIteration
-
-
 class TablePrettyPrinter(object):
 	"""
 	pretty print the contents of a Table to the console
 	"""
+	__slots__ = ('category', 'info')
+
 	vert = '|'
 	horz = '-'
 	dhorz = '='
@@ -53,34 +28,41 @@ class TablePrettyPrinter(object):
 		self.category = table.category
 		self.info = [(c.level, c.long_name) for c in table.rows.values()]
 
-	def get_console_config(self):
+	@staticmethod
+	def get_console_config():
 		size = os.get_terminal_size()
 		return size.columns, size.lines
 
-	def print(self):
-		cols, lines = self.get_console_config()
+	def print(self, cols: int = None):
+		if cols is None:
+			cols, lines = self.get_console_config()
 
 		entry_gap = ' '*self.lwidth # gap in each row before any branch
 		branch = ' '*self.lwidth + self.vert + ' '*(self.rwidth-1)
 		leaf = ' '*self.lwidth + self.vert + self.horz*self.rwidth
 		pad = len(self.ellipses)
 
-		table = self.category + ' Table\n'
+		# long row of double lines placed above every top-level component
+		top_rule = entry_gap + self.dhorz*(cols-self.lwidth) + '\n'
+
+		# rows are collected in a list & joined once at the end; building the
+		#	string by repeated concatenation is quadratic in the number of rows
+		parts = [self.category + ' Table\n']
+		append = parts.append
 		for level, name in self.info:
 			if level:
 				prefix = branch*(level - 1) + leaf
 			else:
-				# if this is a top-level component, add a long row of double lines
-				table = table + entry_gap + self.dhorz*(cols-self.lwidth) + '\n'
+				append(top_rule)
 				prefix = ''
 
 			row_str = entry_gap + prefix + name
 			if len(row_str) - pad > cols:
 				row_str = row_str[:(cols-pad)] + self.ellipses
 
-			table = table + row_str + '\n'
+			append(row_str + '\n')
 
-		return table
+		return ''.join(parts)
 
 
 class Table(object):
@@ -104,6 +86,9 @@ class Table(object):
 		'pce:g:d'
 		...
 	"""
+	__slots__ = (
+		'aggregates', 'category', '_rows', '_codes', '_code_to_pos', '_rendered'
+	)
 
 	def __init__(
 		self,
@@ -114,60 +99,81 @@ class Table(object):
 		self.aggregates = aggregates
 		self.category = category
 
-		# every series in the table as a mapping of {series_code: Component}
-		self.rows = {}
-		def add_series(comp):
-			self.rows[comp.code] = comp
-			for sub in comp.subs:
-				add_series(sub)
-
-		for agg in self.aggregates:
-			add_series(agg)
+		# every series in the table as a mapping of {series_code: Component},
+		#	in depth-first order, the list of those codes for positional
+		#	indexing, and the position of each code. all are filled in a single
+		#	walk of the component trees
+		rows, codes, code_to_pos = {}, [], {}
+		stack = list(reversed(self.aggregates))
+		while stack:
+			comp = stack.pop()
+			code = comp.code
+			if code not in rows:
+				code_to_pos[code] = len(codes)
+				codes.append(code)
+			rows[code] = comp
+			stack.extend(reversed(comp.subs))
+
+		self._rows = rows
+		self._codes = codes
+		self._code_to_pos = code_to_pos
+
+		# printed versions of the table, keyed by the terminal width they were
+		#	rendered for
+		self._rendered = {}
 
 	def __getitem__(self, key: Union[str, int, Iterable[str, int]]):
-		if iterable_not_string(key):
-			comps = []
-			for k in key:
-				if isinstance(k, str):
-					comps.append(self.rows[k])
-				elif isinstance(k, int):
-					comps.append(self.rows[self._codes[k]])
-				else:
-					self._error(k)
-
-			return tuple(comps)
-
-		elif isinstance(key, str):
+		# single str & int keys are by far the most common, so they're checked
+		#	first
+		if isinstance(key, str):
 			try:
-				return self.rows[key]
-			except:
+				return self._rows[key]
+			except KeyError:
 				self._error(key)
 
 		elif isinstance(key, int):
 			try:
-				return self.rows[self._codes[key]]
-			except:
+				return self._rows[self._codes[key]]
+			except IndexError:
 				self._error(key)
 
 		elif isinstance(key, slice):
 
 			def _get_idx(k):
 				try:
-					return self._codes.index(k)
-				except ValueError:
+					return self._code_to_pos[k]
+				except KeyError:
 					self._error(k)
 
 			start, stop = key.start, key.stop
 			start = _get_idx(start) if isinstance(start, str) else start
 			stop = _get_idx(stop) if isinstance(stop, str) else stop
 
+			rows, codes = self._rows, self._codes
 			comps = []
+			append = comps.append
 			for k in range(start, stop):
 				try:
-					code = self._codes[k]
+					code = codes[k]
 				except IndexError:
 					raise self._error(k)
-				comps.append(self.rows[code])
+				append(rows[code])
+
+			return tuple(comps)
+
+		elif iterable_not_string(key):
+			# the rows & codes are bound to locals before the loop, so they
+			#	aren't looked up on the instance for every element
+			rows, codes = self._rows, self._codes
+			comps = []
+			append = comps.append
+			for k in key:
+				if isinstance(k, str):
+					append(rows[k])
+				elif isinstance(k, int):
+					append(rows[codes[k]])
+				else:
+					self._error(k)
 
 			return tuple(comps)
 
@@ -177,22 +183,35 @@ class Table(object):
 				"of those str and int"
 			) from None
 
+	@property
+	def rows(self):
+		"""
+		read-only mapping of {series_code: Component} of every series in the
+		table. tables are meant to represent published tables, so they're
+		immutable; the mapping is a view of the table's rows that can't be
+		modified
+		"""
+		return types.MappingProxyType(self._rows)
+
 	def __iter__(self):
-		return TableIterator(self._codes)
+		return iter(self._codes)
 
 	def __repr__(self):
 		return f"{self.category} Table"
 
 	def __str__(self):
-		printer = TablePrettyPrinter(self)
-		return printer.print()
+		# the rows of a table don't change once it's constructed, so the printed
+		#	table only needs to be rendered again if the terminal width changes
+		cols, _ = TablePrettyPrinter.get_console_config()
+		try:
+			return self._rendered[cols]
+		except KeyError:
+			rendered = TablePrettyPrinter(self).print(cols)
+			self._rendered[cols] = rendered
+			return rendered
 
 	def __len__(self):
-		return len(self.rows)
-
-	@functools.cached_property
-	def _codes(self):
-		return list(self.rows.keys())
+		return len(self._rows)
 
 	def _error(self, key):
 		cat = self.category if self.category else 'this'
@@ -202,17 +221,3 @@ class Table(object):
 			raise IndexError(f"{key}. {cat} table has {len(self)} rows") from None
 		else:
 			raise TypeError(f"{type(key)}. can only be str or int")
-
-	# make the table is immutable, as they are meant to represent published tables
-	# taken from
-	#	https://www.python.org/dev/peps/pep-0351
-	def _immutable(self, *args, **kwargs):
-		raise TypeError("Tables are immutable")
-
-	__setitem__ = _immutable
-	__delitem__ = _immutable
-	clear = _immutable
-	update = _immutable
-	setdefault = _immutable
-	pop = _immutable
-	popitem = _immutable
@@ -8,6 +8,9 @@ aggregate components
 
 from __future__ import annotations
 
+import functools
+from collections.abc import Mapping
+
 import pandas as pd
 import numpy as np
 
@@ -39,29 +42,187 @@ class DataTransform(object):
 				return f"{n}-prd. {self._unit}"
 		return self._unit
 
-	def __call__(self, data, n, h):
+	def compute(self, data, n, h):
+		"""the transformed values of `data`, as a numpy ndarray"""
 		return self.func(data, n, h)
 
+	def __call__(self, data, n, h):
+		return _wrap(data, self.func(data, n, h))
+
+def _lagged(ufunc, s, n):
+	"""
+	apply the binary ufunc `ufunc` to the values of `s` and their `n`-period lag,
+	writing directly into a single output array. the lag is taken by slicing
+	the underlying ndarray, so no shifted copy of `s` is ever materialized and
+	no index alignment is done. the first `n` rows of the output are NaN
+
+	Parameters
+	----------
+	ufunc : numpy ufunc
+		binary function called as `ufunc(x(t), x(t-n))`
+	s : pandas Series | pandas DataFrame
+		the data. DataFrames are lagged along the index
+	n : int
+		the number of periods to lag
+
+	Returns
+	-------
+	numpy ndarray
+	"""
+	arr = s.to_numpy(dtype=np.float64)
+	t = arr.shape[0]
+	m = min(abs(n), t)
+
+	# zeros & missing values give inf & NaN silently, like pandas arithmetic
+	out = np.empty(arr.shape, dtype=np.float64)
+	with np.errstate(divide='ignore', invalid='ignore'):
+		if n >= 0:
+			out[:m] = np.nan
+			ufunc(arr[m:], arr[:t-m], out=out[m:])
+		else:
+			out[t-m:] = np.nan
+			ufunc(arr[:t-m], arr[m:], out=out[:t-m])
+
+	return out
+
+def _wrap(s, arr):
+	"""re-wrap `arr` in a pandas object with the same index & labels as `s`"""
+	if isinstance(s, pd.DataFrame):
+		return pd.DataFrame(arr, index=s.index, columns=s.columns)
+	return pd.Series(arr, index=s.index, name=s.name)
+
+def _change(s, n):
+	"""
+	change
+		x(t) - x(t-n)
+	"""
+	return _lagged(np.subtract, s, n)
+
+def _pct_change(s, n, power=1.0):
+	"""
+	percent change, compounded by `power`
+		100 * [ (x(t)/x(t-n))^power - 1 ]
+	"""
+	out = _lagged(np.divide, s, n)
+	if power != 1.0:
+		with np.errstate(divide='ignore', invalid='ignore'):
+			np.power(out, power, out=out)
+	out -= 1.0
+	out *= 100.0
+	return out
+
+def _log_change(s, n, scale=100.0):
+	"""
+	log change, scaled by `scale`
+		scale * ln[ x(t)/x(t-n) ]
+	"""
+	out = _lagged(np.divide, s, n)
+	with np.errstate(divide='ignore', invalid='ignore'):
+		np.log(out, out=out)
+	out *= scale
+	return out
+
+def _moving_sum(s, n):
+	"""
+	n-period moving total
+		sum_{j=0}^{n-1} x(t-j)
+
+	each window is summed directly from a strided view of the data, rather
+	than by differencing a running sum, which loses precision when large values
+	precede small ones. a window with a missing observation sums to NaN, which
+	matches pandas' `rolling(n).sum()`
+	"""
+	if n < 1:
+		raise ValueError(f"moving window must be a positive integer, not {n}")
+
+	arr = s.to_numpy(dtype=np.float64)
+	t = arr.shape[0]
+
+	out = np.empty(arr.shape, dtype=np.float64)
+	out[:n-1] = np.nan
+	if n > t:
+		return out
+
+	windows = np.lib.stride_tricks.sliding_window_view(arr, n, axis=0)
+	np.sum(windows, axis=-1, out=out[n-1:])
+
+	return out
+
+def _diff(s, n, h):
+	return _change(s, n)
+
+def _diffp(s, n, h):
+	return _pct_change(s, n)
+
+def _diffl(s, n, h):
+	return _log_change(s, n)
+
+def _difa(s, n, h):
+	out = _change(s, n)
+	out *= h/n
+	return out
+
+def _difap(s, n, h):
+	return _pct_change(s, n, h/n)
+
+def _difal(s, n, h):
+	return _log_change(s, n, 100 * (h/n))
+
+def _difv(s, n, h):
+	out = _change(s, n)
+	out /= n
+	return out
+
+def _difvl(s, n, h):
+	return _log_change(s, n, 100/n)
+
+def _movv(s, n, h):
+	out = _moving_sum(s, n)
+	out /= n
+	return out
+
+def _mova(s, n, h):
+	out = _moving_sum(s, n)
+	out /= n
+	out *= h
+	return out
+
+def _movt(s, n, h):
+	return _moving_sum(s, n)
+
+def _yryr(s, n, h):
+	return _change(s, h)
+
+def _yryrp(s, n, h):
+	return _pct_change(s, h)
+
+def _yryrl(s, n, h):
+	return _log_change(s, h)
+
+
 series_transforms = dict()
 def deft(key, func, unit=''):
 	"""define transform"""
 	series_transforms[key] = DataTransform(key, func, unit)
 
-deft('diff',	lambda s, n, h: s.diff(n), 'chg.')
-deft('diff%',	lambda s, n, h: 100 * (s.divide(s.shift(n)) - 1), '% chg.')
-deft('diffl',	lambda s, n, h: 100 * np.log(s.divide(s.shift(n))), 'log chg.')
-deft('difa',	lambda s, n, h: (h/n) * s.diff(n), 'ann. chg.')
-deft('difa%',	lambda s, n, h: 100 * ( s.divide(s.shift(n)) ** (h/n) - 1), 'ann. % chg.')
-deft('difal',	lambda s, n, h: 100 * (h/n) * np.log(s.divide(s.shift(n))), 'ann. log chg.')
-deft('difv',	lambda s, n, h: s.diff(n)/n, 'avg. chg.')
-deft('difv%',	lambda s, n, h: 100 * (s.divide(s.shift(n)) ** (h/n) - 1), 'avg. % chg.')
-deft('difvl',	lambda s, n, h: (100/n) * np.log(s.divide(s.shift(n))), 'avg. log chg.')
-deft('movv',	lambda s, n, h: s.rolling(n).mean(), 'moving avg.')
-deft('mova',	lambda s, n, h: h * s.rolling(n).mean(), 'ann. moving avg.')
-deft('movt',	lambda s, n, h: s.rolling(n).sum(), 'moving sum')
-deft('yryr',	lambda s, n, h: s.diff(h), 'yr/yr chg.')
-deft('yryr%',	lambda s, n, h: 100 * (s.divide(s.shift(h)) - 1), 'yr/yr % chg.')
-deft('yryrl',	lambda s, n, h: 100 * np.log(s.divide(s.shift(h))), 'yr/yr log chg.')
+deft('diff',	_diff, 'chg.')
+deft('diff%',	_diffp, '% chg.')
+deft('diffl',	_diffl, 'log chg.')
+deft('difa',	_difa, 'ann. chg.')
+deft('difa%',	_difap, 'ann. % chg.')
+deft('difal',	_difal, 'ann. log chg.')
+deft('difv',	_difv, 'avg. chg.')
+deft('difv%',	_difap, 'avg. % chg.')
+deft('difvl',	_difvl, 'avg. log chg.')
+deft('movv',	_movv, 'moving avg.')
+deft('mova',	_mova, 'ann. moving avg.')
+deft('movt',	_movt, 'moving sum')
+deft('yryr',	_yryr, 'yr/yr chg.')
+deft('yryr%',	_yryrp, 'yr/yr % chg.')
+deft('yryrl',	_yryrl, 'yr/yr log chg.')
+
+# bound once so the lookup in `TransformationAccessor.__transform__` is one call
+_get_transform = series_transforms.get
 
 
 class ReIndexer(object):
@@ -94,7 +255,8 @@ class ReIndexer(object):
 
 	@property
 	def data_freq(self):
-		return infer_freq(self.data)
+		"""frequency of `self.data`, inferred once per call of the ReIndexer"""
+		return self._freq
 
 
 	def base_data_from_integer(self):
@@ -127,10 +289,20 @@ class ReIndexer(object):
 		"""
 		freq = self.data_freq
 		if freq == 'D':
-			rebase = self.data.loc[self.base]
+			# a list keeps the selection a Series/DataFrame even for a Series
+			try:
+				rebase = self.data.loc[[self.base]]
+			except KeyError:
+				raise IndexError(
+					f"no data in the rebase period {self.base}"
+				) from None
 		else:
-			df = self.data
-			rebase = df.loc[(df.index >= self.base) & (df.index <= self.base)]
+			# the index is sorted, so the rows at `self.base` are found with two
+			#	binary searches rather than full boolean masks of the index
+			index = self.data.index
+			lo = index.searchsorted(self.base, side='left')
+			hi = index.searchsorted(self.base, side='right')
+			rebase = self.data.iloc[lo:hi]
 
 		if rebase.empty:
 			raise IndexError(f"no data in the rebase period {self.base}")
@@ -151,6 +323,7 @@ class ReIndexer(object):
 	def __call__(self, data):
 
 		self.data = data
+		self._freq = infer_freq(data)
 
 		rebase = self.base_data
 		base_value = rebase.mean(axis='index')
@@ -166,6 +339,14 @@ class TransformationAccessor(object):
 		else:
 			self.data = obj.data
 
+	@functools.cached_property
+	def _h(self):
+		"""
+		default number of periods per year of `self.data`. inferring the frequency
+		walks the entire index, so it's only done once per accessor
+		"""
+		return periods_per_year(self.data)
+
 	def __call__(
 		self,
 		method: Union[str, Callable, Iterable[str, dict]] = 'difa%',
@@ -262,15 +443,23 @@ class TransformationAccessor(object):
 		transform : pandas DataFrame or Series
 		"""
 
-		if isinstance(method, (str, dict)) or callable(method):
+		if isinstance(method, (str, Mapping)) or callable(method):
 			return self.__transform__(method, n, h, base, **kwargs)
 
 		elif iterable_not_string(method):
+			methods = list(method)
+
+			if all(isinstance(m, str) for m in methods):
+				# the common case of a list of method names
+				if isinstance(self.data, pd.Series):
+					transformers = [_get_transform(m) for m in methods]
+					if all(transformers):
+						return self._transform_columns(transformers, n, h)
 
-			frames = []
-			for meth in method:
-				df = self.__transform__(meth, n, h, base, **kwargs)
-				frames.append(df)
+				frames = [self._transform_str(m, n, h, base) for m in methods]
+
+			else:
+				frames = [self.__transform__(m, n, h, base, **kwargs) for m in methods]
 
 			df = pd.concat(frames, axis='columns').dropna(axis='index', how='all')
 			return df
@@ -278,6 +467,46 @@ class TransformationAccessor(object):
 		else:
 			raise TypeError(method)
 
+	def _transform_str(self, method: str, n: int, h: int, base):
+		"""
+		apply the transformation identified by the string `method`, skipping the
+		dict & callable checks of `__transform__`
+		"""
+		if method == 'index':
+			rix = ReIndexer(base)
+			return rix(self.data)
+
+		# one of the time-series functions
+		transformer = _get_transform(method)
+		if transformer is None:
+			raise KeyError(f"{repr(method)} is an unrecognized transformation")
+
+		return transformer(self.data, n, h or self._h)
+
+	def _transform_columns(self, transformers: list, n: int, h: int):
+		"""
+		apply several built-in transformations to Series data, writing each into
+		a column of one preallocated array rather than concatenating a Series per
+		transformation. the result matches the concatenated frames, including
+		dropping periods where every column is NaN
+		"""
+		data = self.data
+		h = h or self._h
+
+		out = np.empty((len(data), len(transformers)), dtype=np.float64)
+		for j, transformer in enumerate(transformers):
+			out[:, j] = transformer.compute(data, n, h)
+
+		if data.name is None:
+			columns = pd.RangeIndex(len(transformers))
+		else:
+			columns = [data.name] * len(transformers)
+
+		observed = ~np.isnan(out).all(axis=1)
+		if observed.all():
+			return pd.DataFrame(out, index=data.index, columns=columns)
+		return pd.DataFrame(out[observed], index=data.index[observed], columns=columns)
+
 	def __transform__(self,
 		method: Union[str, dict, Callable] = 'difa%',
 		n: int = 1,
@@ -286,54 +515,84 @@ class TransformationAccessor(object):
 		**kwargs
 	):
 
-		try:
-			# assume `method` is a dict
-			keys = list(method.keys())
+		if isinstance(method, str):
+			return self._transform_str(method, n, h, base)
 
-			method_copy = method.copy()
-			first_key = keys[0]
-			maybe_callable = method[first_key]
+		if isinstance(method, Mapping):
+			# the first value is the method, the rest are its parameters
+			method_copy = dict(method)
+			first_key = next(iter(method))
+			maybe_callable = method_copy.pop(first_key)
 
 			if callable(maybe_callable):
-				_ = method_copy.pop(first_key)
 				kwargs.update(method_copy)
-				df = self.__transform__(maybe_callable, **kwargs)
+				return self.__transform__(maybe_callable, **kwargs)
+
+			n_ = method_copy.pop('n', n)
+			h_ = method_copy.pop('h', h)
+			base_ = method_copy.pop('base', base)
+			return self.__transform__(maybe_callable, n_, h_, base_)
+
+		if callable(method):
+			# `method` is a user-provided function
+			if kwargs:
+				return method(self.data, **kwargs)
+			return method(self.data)
+
+		raise KeyError(f"{repr(method)} is an unrecognized transformation")
+
+	@classmethod
+	def apply_many(
+		cls,
+		series: Iterable[pd.Series],
+		method: str = 'difa%',
+		n: int = 1,
+		h: int = 0
+	):
+		"""
+		apply the same built-in transformation to several series at once. the
+		series are stacked as the columns of one DataFrame and transformed in a
+		single pass, rather than each being transformed & concatenated later
 
-			else:
-				n_ = method_copy.pop('n', n)
-				h_ = method_copy.pop('h', h)
-				base_ = method_copy.pop('base', base)
-				df = self.__transform__(maybe_callable, n_, h_, base_)
+		Parameters
+		----------
+		series : Iterable[pandas Series]
+			the series to transform. if their indices differ, they're aligned on
+			the union of the indices first
+		method : str ( = 'difa%' )
+			one of the string methods accepted by `__call__`, other than 'index'
+		n : int ( = 1 )
+			the period offset used in the built-in method functions
+		h : int ( = 0 )
+			forcing the number-of-periods-per-year value
 
-		except AttributeError:
-			# assume `method` is a user-provided function
+		Returns
+		-------
+		transform : pandas DataFrame
+			one column per series, labeled by the series' names
+		"""
+		try:
+			transformer = series_transforms[method]
+		except KeyError:
+			raise KeyError(
+				f"{repr(method)} is an unrecognized transformation"
+			) from None
 
-			if callable(method):
-				if kwargs:
-					df = method(self.data, **kwargs)
-				else:
-					df = method(self.data)
+		series = list(series)
+		if not series:
+			raise ValueError("at least one series must be provided")
+
+		index = series[0].index
+		if all(s.index.equals(index) for s in series[1:]):
+			data = pd.DataFrame(
+				np.column_stack([s.to_numpy(dtype=np.float64) for s in series]),
+				index=index,
+				columns=[s.name for s in series]
+			)
+		else:
+			data = pd.concat(series, axis='columns')
 
-			else:
-				# now assume `method` is a string identifier of registered functions
-				if method == 'index':
-					rix = ReIndexer(base)
-					return rix(self.data)
-
-				else:
-					# one of the time-series functions
-					try:
-						transformer = series_transforms[method]
-					except KeyError:
-						raise KeyError(
-							f"{repr(method)} is an unrecognized transformation"
-						) from None
-
-					if not h:
-						h = periods_per_year(self.data)
-					df = transformer(self.data, n, h)
-
-		return df
+		return transformer(data, n, h or periods_per_year(data))
 
 
 def transform(
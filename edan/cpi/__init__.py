@@ -3,4 +3,10 @@ from edan.cpi.core import (
 	CPIComponent
 )
 
-from edan.cpi.api import CPITable
+
+def __getattr__(name: str):
+	# `CPITable` is built on first access; see `edan.cpi.api`
+	if name == 'CPITable':
+		from edan.cpi.api import CPITable
+		return CPITable
+	raise AttributeError(f"module {repr(__name__)} has no attribute {repr(name)}")
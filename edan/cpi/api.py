@@ -1,7 +1,11 @@
 """
-module that prepares the CPI component table
+module that prepares the CPI component table. the table is only built the
+first time `CPITable` is accessed, so importing `edan.cpi` doesn't construct
+the CPI component tree until it's needed
 """
 
+import functools
+
 from edan.algos import construct_forest
 from edan.core.tables import Table
 from edan.core.register import registry
@@ -9,7 +13,13 @@ from edan.core.register import registry
 from edan.cpi.core import CPIComponent
 
 
-flat_cpi = [CPIComponent.from_registry(e) for e in registry.by_table('cpi')]
-construct_forest(flat_cpi, level='level', lower='subs')
+@functools.lru_cache(maxsize=None)
+def _build_cpi_table():
+	flat_cpi = CPIComponent.from_registry_many(registry.by_table('cpi'))
+	construct_forest(flat_cpi, level='level', lower='subs')
+	return Table(flat_cpi, 'CPI')
 
-CPITable = Table(flat_cpi, 'CPI')
+def __getattr__(name: str):
+	if name == 'CPITable':
+		return _build_cpi_table()
+	raise AttributeError(f"module {repr(__name__)} has no attribute {repr(name)}")
@@ -11,13 +11,6 @@ from edan.core.transformations import TransformationAccessor
 
 class CPISeries(Series):
 
-	def __init__(
-		self,
-		code: str, mtype: str, comp: Component,
-		*args, **kwargs
-	):
-		super().__init__(code, mtype=mtype, source=comp.source, comp=comp)
-
 	# add accessor for functions of data
 	transform = CachedAccessor('transform', TransformationAccessor)
 
@@ -3,9 +3,12 @@
 """
 
 import urllib.request as urequest
-import json
 import pathlib
 
+from concurrent.futures import ThreadPoolExecutor
+
+from edan.utils.jsonio import loads_json, dump_json
+
 
 
 # url of crosswalks repo & directory name of local crosswalks
@@ -28,17 +31,19 @@ def retrieve_from_git(name):
 	else:
 		full_url = '/'.join((git_url, name))
 		with urequest.urlopen(full_url) as url:
-			data = json.load(url)
+			data = loads_json(url.read())
 
-		with open(local_name, 'w') as json_file:
-			json.dump(data, json_file, indent=4)
+		dump_json(data, local_name)
 
-retrieve_from_git(pceu)
-retrieve_from_git(gdpd)
-retrieve_from_git(gdp)
+# the crosswalks are only downloaded the first time edan is imported. they're
+#	independent of each other, so they're fetched concurrently
+crosswalks = (pceu, gdpd, gdp)
+if not all((warehouse / name).exists() for name in crosswalks):
+	with ThreadPoolExecutor(max_workers=len(crosswalks)) as executor:
+		list(executor.map(retrieve_from_git, crosswalks))
 
 
 
 # create funnels for aliases
-from edan.data.aliases.mappings import aliases_by_source
-alias_maps = {s: aliases_by_source(s) for s in ('fred', 'bea', 'bls')}
+from edan.data.aliases.mappings import aliases_all_sources
+alias_maps = aliases_all_sources(('fred', 'bea', 'bls'))
@@ -4,9 +4,10 @@
 from __future__ import annotations
 
 import pathlib
-import json
 import funnelmap as fmap
 
+from edan.utils.jsonio import load_json
+
 
 # getting the existing paths to the already retreived jsons
 warehouse = pathlib.Path(__file__).parent / 'warehouse'
@@ -14,10 +15,7 @@ warehouse = pathlib.Path(__file__).parent / 'warehouse'
 stored_maps = []
 for child in warehouse.iterdir():
 	if child.suffix == '.json':
-
-		with open(child, 'r') as json_file:
-			local_mapping = json.load(json_file)
-		stored_maps.append(local_mapping)
+		stored_maps.append(load_json(child))
 
 
 # need separate 'nominal' & 'nominal_level' and 'real' & 'real_level' measures
@@ -31,8 +29,7 @@ def sniff_sources(mappings: dict):
 	"""
 	read & return the source APIs that have codes stored in this mapping
 	"""
-	first_key = list(mappings.keys())[0]
-	first_entry = mappings[first_key]
+	first_entry = mappings[next(iter(mappings))]
 
 	for meas in measures:
 		try:
@@ -42,57 +39,78 @@ def sniff_sources(mappings: dict):
 			pass
 
 
-def aliases_by_source(source: str) -> FunnelMap:
+recognized_sources = {'bea', 'fred', 'av', 'bls'}
+
+def aliases_all_sources(sources: Iterable[str]) -> dict:
 	"""
-	given a source name ('bea', 'fred', 'av'), construct a single mapping
-	of all the aliases in all the stored JSONs that point towards identifiers
-	of that source API.
+	construct the alias mappings of several source APIs at once. the stored
+	JSONs are walked a single time, and each identifier's aliases are routed to
+	the mapping of every requested source that identifier belongs to
 
 	Parameters
 	----------
-	source : str {'bea', 'fred', 'av'}
-		the source API
+	sources : Iterable[str] {'bea', 'fred', 'av', 'bls'}
+		the source APIs
 
 	Returns
 	-------
-	FunnelMap
+	dict of {source: FunnelMap}
 	"""
+	sources = tuple(sources)
+	for source in sources:
+		if source not in recognized_sources:
+			raise ValueError(f"{repr(source)} not a recognized source API yet")
 
-	if source not in {'bea', 'fred', 'av', 'bls'}:
-		raise ValueError(f"{repr(source)} not a recognized source API yet")
-
-	# if source == 'bls':
-	# 	raise NotImplementedError('bls')
-
-	# elif source == 'av':
-	# 	raise NotImplementedError('av')
-
-	# only want to use mappings that have ids for 'source' API
-	src_mappings = []
+	alias_dicts = {s: {} for s in sources}
 	for mapping in stored_maps:
 
-		if source in sniff_sources(mapping):
-			src_mappings.append(mapping)
+		# only want to use mappings that have ids for each source API
+		present = sniff_sources(mapping) or ()
+		map_sources = [s for s in sources if s in present]
+		if not map_sources:
+			continue
 
-	alias_dict = {}
-	for src_map in src_mappings:
-		for src_info in src_map.values():
+		for src_info in mapping.values():
 			for meas in measures:
 
-				try:
-					# some series don't have certain measures; e.g. Net Exports
-					#	doesn't have quantity or price indices
-					mdict = src_info[meas].copy()
+				# some series don't have certain measures; e.g. Net Exports
+				#	doesn't have quantity or price indices
+				mdict = src_info.get(meas)
+				if not mdict:
+					continue
+
+				for source in map_sources:
+					if source not in mdict:
+						continue
 
-					id_ = mdict.pop(source)
-					aliases = [al for al in mdict.values()]
+					aliases = [al for src, al in mdict.items() if src != source]
+					alias_dict = alias_dicts[source]
 
+					id_ = mdict[source]
 					if id_ in alias_dict:
 						alias_dict[id_].extend(aliases)
 					else:
 						alias_dict[id_] = aliases
 
-				except KeyError:
-					pass
+	return {
+		s: fmap.FunnelMap(alias_dict, strict=False)
+		for s, alias_dict in alias_dicts.items()
+	}
+
 
-	return fmap.FunnelMap(alias_dict, strict=False)
+def aliases_by_source(source: str) -> FunnelMap:
+	"""
+	given a source name ('bea', 'fred', 'av'), construct a single mapping
+	of all the aliases in all the stored JSONs that point towards identifiers
+	of that source API.
+
+	Parameters
+	----------
+	source : str {'bea', 'fred', 'av'}
+		the source API
+
+	Returns
+	-------
+	FunnelMap
+	"""
+	return aliases_all_sources((source,))[source]
@@ -6,6 +6,8 @@ economic data
 import json
 import pathlib
 
+from edan.utils.jsonio import load_json, dump_json
+
 
 
 # directory containing the JSON of API keys & filename that stores that JSON
@@ -23,35 +25,50 @@ class APIKeyChain(object):
 		# create keychain record if it doesn't exist
 		self.keychain_path.touch(exist_ok=True)
 
-		with open(self.keychain_path, 'r') as key_file:
-			try:
-				key_list = json.load(key_file)
-			except json.decoder.JSONDecodeError:
-				# in case key_file is empty
-				key_list = []
-
-		self.api_keys = {}
-		for api in key_list:
-			s, k = api['source'], api['key']
-			self.api_keys[s] = k
+		try:
+			keys = load_json(self.keychain_path)
+		except json.decoder.JSONDecodeError:
+			# in case key_file is empty
+			keys = {}
+
+		# the keychain is stored as a mapping of {source: key}
+		if isinstance(keys, list):
+			# keychains written by older versions are a list of
+			#	{'source': ..., 'key': ...} records. convert them once &
+			#	re-write the file in the current layout
+			self.api_keys = {api['source']: api['key'] for api in keys}
+			self.write_updated_keychain()
+		else:
+			self.api_keys = keys
 
 	def write_updated_keychain(self):
 		"""write new API sources and keys to keychain file"""
 
-		key_list = []
-		for source, key in self.api_keys.items():
-			api_dict = {'source': source, 'key': key}
-			key_list.append(api_dict)
-
-		with open(self.keychain_path, 'w') as key_file:
-			json.dump(key_list, key_file, indent=4)
+		dump_json(self.api_keys, self.keychain_path)
 
 	def add_to_keychain(self, source: str, key: str):
+		"""
+		add a new API source and key to the saved list of keys
+
+		Parameters
+		----------
+		source : str
+			the name of the entity hosting the API data
+		key : str
+			the user-assigned login key for the API
+		"""
 		self.api_keys[source] = key
 		self.write_updated_keychain()
 
 	def __getitem__(self, source: str):
-		"""retrieve the saved API key based on the source name"""
+		"""
+		retrieve saved API key given the source name
+
+		Parameters
+		----------
+		source : str
+			the name of the entity hosting the API data
+		"""
 		try:
 			return self.api_keys[source]
 		except KeyError:
@@ -64,29 +81,10 @@ keychain = APIKeyChain()
 
 
 
-def add_api_key(source: str, key: str):
-	"""
-	add a new API source and key to the saved list of keys
-
-	Parameters
-	----------
-	source : str
-		the name of the entity hosting the API data
-	key : str
-		the user-assigned login key for the API
-	"""
-	keychain.add_to_keychain(source, key)
-
-def retrieve_api_key(source: str):
-	"""
-	retrieve saved API key given the source name
-
-	Parameters
-	----------
-	source : str
-		the name of the entity hosting the API data
-	"""
-	return keychain[source]
+# adding & retrieving keys are the keychain's own bound methods, rather than
+#	functions that forward their arguments to them
+add_api_key = keychain.add_to_keychain
+retrieve_api_key = keychain.__getitem__
 
 def update_api_key(source: str, key: str):
 	"""
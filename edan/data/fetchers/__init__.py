@@ -1,13 +1,55 @@
-from edan.data.fetchers.fred_fetcher import FredFetcher
-from edan.data.fetchers.av_fetcher import AlphaVantageFetcher
-from edan.data.fetchers.bea_fetcher import BeaFetcher
+"""
+fetchers for each API source. a fetcher's module imports the client library of
+its API, so sources are registered by the dotted path to their fetcher and the
+module is only imported the first time that source is used
+"""
+
+from __future__ import annotations
+
+import importlib
 
 from edan.data.fetchers.base import EdanFetcher
 
-fetchers_by_source = {}
+
+class FetcherMapping(dict):
+	"""
+	mapping of {source: fetcher}, where a fetcher can be registered as a class,
+	an initialized fetcher, or the dotted import path of a class. paths are
+	imported & replaced by the class the first time they're looked up
+	"""
+
+	def __getitem__(self, source: str):
+		fetcher = super().__getitem__(source)
+		if isinstance(fetcher, str):
+			module, _, attr = fetcher.rpartition('.')
+			fetcher = getattr(importlib.import_module(module), attr)
+			self[source] = fetcher
+		return fetcher
+
+fetchers_by_source = FetcherMapping()
 def add_source(source, fetcher):
 	fetchers_by_source[source] = fetcher
 
-add_source('fred', FredFetcher)
-add_source('av', AlphaVantageFetcher)
-add_source('bea', BeaFetcher)
+add_source('fred', 'edan.data.fetchers.fred_fetcher.FredFetcher')
+add_source('av', 'edan.data.fetchers.av_fetcher.AlphaVantageFetcher')
+add_source('bea', 'edan.data.fetchers.bea_fetcher.BeaFetcher')
+
+
+_fetcher_classes = {
+	'FredFetcher': 'fred',
+	'AlphaVantageFetcher': 'av',
+	'BeaFetcher': 'bea'
+}
+
+def __getattr__(name: str):
+	# the fetcher classes used to be imported here directly; they're still
+	#	available, but are imported on first access
+	try:
+		source = _fetcher_classes[name]
+	except KeyError:
+		raise AttributeError(
+			f"module {repr(__name__)} has no attribute {repr(name)}"
+		) from None
+
+	fetcher = fetchers_by_source[source]
+	return fetcher if isinstance(fetcher, type) else type(fetcher)
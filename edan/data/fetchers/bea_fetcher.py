@@ -47,46 +47,40 @@ class BeaFetcher(EdanFetcher):
 
 	def format_data(self, data: Series, code: str):
 
-		# index is one of {'yyyyMmm', 'yyyyQq', 'yyyy'}
-		freq = data.index.to_frame(name='string')
-
-		freq['M'] = freq.string.str.contains('M')
-		freq['Q'] = freq.string.str.contains('Q')
-		freq['A'] = ~(freq['M'] | freq['Q'])
-
-		# get "ValueError: 'q' is a bad directive in format '%YQ%q' for quarterly
-		#	data when 'Q': '%YQ%q' is the mapping in `freq_fmts`? so we need to
-		#	change that string before formatting
-		freq_fmts = {
-			'M': '%YM%m',
-			'Q': '%YM%m',
-			'A': '%Y'
-		}
-		for f in freq_fmts.keys():
-			idx = freq[f]
-			if f == 'Q':
-				yr = freq.string[idx].str[:4].astype(str)
-				mo = 3 * freq.string[idx].str[-1].astype(int)
-
-				fq = (yr + 'M').str.cat(mo.astype(str).str.zfill(2))
-				freq.string[idx] = fq
-			freq.loc[idx, 'dt'] = pd.to_datetime(freq.string[idx], format=freq_fmts[f])
-
-		data.index = freq.dt
+		# index is one of {'yyyyMmm', 'yyyyQq', 'yyyy'}. every series in a
+		#	response from BEA has the same frequency, so the format is determined
+		#	once from the first date & the whole index is parsed in one go
+		strings = data.index.astype(str)
+		first = strings[0] if len(strings) else ''
+
+		if 'M' in first:
+			dates = pd.to_datetime(strings, format='%YM%m')
+		elif 'Q' in first:
+			# quarters are dated by the first day of their last month
+			quarters = pd.PeriodIndex(strings, freq='Q')
+			dates = quarters.asfreq('M', how='end').to_timestamp()
+		else:
+			dates = pd.to_datetime(strings, format='%Y')
+
+		data.index = dates
 		data.index.name = ''
 		data.name = code
 		return data
 
 	def format_metadata(self, meta: Series, code: str, freq: str):
 		""" """
-		additional_meta = pd.Series(
-			[self.date_fetched.strftime('%Y-%m-%d'), 'bea', freq],
-			index=['date_fetched', 'source', 'frequency']
+		fetched_meta = pd.Series(
+			[self.date_fetched.strftime('%Y-%m-%d')],
+			index=['date_fetched']
 		)
-		metadata = meta.append(additional_meta)
+		freq_meta = pd.Series([freq], index=['frequency'])
+		metadata = pd.concat([meta, fetched_meta, self._source_meta, freq_meta])
 		metadata.name = code
 		return metadata
 
 	def __init__(self, api_key: str = ''):
 		# initialize BEA class in `api` attribute
 		super().__init__('bea', BEA, api_key)
+
+		# metadata that's the same for every series this fetcher retrieves
+		self._source_meta = pd.Series([self.source], index=['source'])
@@ -29,14 +29,17 @@ class FredFetcher(EdanFetcher):
 	def format_metadata(self, meta: Series, code: str):
 		""" """
 		# format date_fetched in the same way FRED formats other dates
-		additional_meta = pd.Series(
-			[self.date_fetched.strftime('%Y-%m-%d'), 'fred'],
-			index=['date_fetched', 'source']
+		fetched_meta = pd.Series(
+			[self.date_fetched.strftime('%Y-%m-%d')],
+			index=['date_fetched']
 		)
-		metadata = meta.append(additional_meta)
+		metadata = pd.concat([meta, fetched_meta, self._source_meta])
 		metadata.name = code
 		return metadata
 
 	def __init__(self, api_key: str = ''):
 		# initialize Fred class in `api` attribute
 		super().__init__('fred', Fred, api_key)
+
+		# metadata that's the same for every series this fetcher retrieves
+		self._source_meta = pd.Series([self.source], index=['source'])
@@ -5,6 +5,8 @@ module for recording & retrieving data series, api sources, and frequencies
 import json
 import pathlib
 
+from edan.utils.jsonio import load_json, dump_json
+
 # directory that contains the JSON of series information
 data_dir = pathlib.Path(__file__).parent
 inv_file = '.inventory.json'
@@ -16,20 +18,30 @@ class EdanInventory(object):
 
 	def __init__(self):
 
+		# additions are held in memory until `flush` is called, so several of
+		#	them can be written to disk in one go
+		self._dirty = False
+
 		# create inventory if it doesn't exist
 		self.inventory_path.touch(exist_ok=True)
 
-		with open(self.inventory_path, 'r') as inv_file:
-			try:
-				inv_list = json.load(inv_file)
-			except json.decoder.JSONDecodeError:
-				# in case inv_file is empty
-				inv_list = []
-
-		self.inv_maps = {}
-		for dct in inv_list:
-			source, freq = dct['source'], dct['freq']
-			self.inv_maps[dct['code']] = (source, freq)
+		try:
+			inv = load_json(self.inventory_path)
+		except json.decoder.JSONDecodeError:
+			# in case inv_file is empty
+			inv = {}
+
+		# the inventory is stored as a mapping of {code: [source, freq]}
+		if isinstance(inv, list):
+			# inventories written by older versions are a list of
+			#	{'code': ..., 'source': ..., 'freq': ...} records. convert them
+			#	once & re-write the file in the current layout
+			self.inv_maps = {
+				dct['code']: (dct['source'], dct['freq']) for dct in inv
+			}
+			self.write_updated_inventory()
+		else:
+			self.inv_maps = {code: tuple(info) for code, info in inv.items()}
 
 	def __contains__(self, code: str):
 		return code in self.inv_maps
@@ -45,16 +57,19 @@ class EdanInventory(object):
 	def write_updated_inventory(self):
 		"""write new data series information to inventory file"""
 
-		inv_list = []
-		for code, info in self.inv_maps.items():
-			dct = {'code': code, 'source': info[0], 'freq': info[1]}
-			inv_list.append(dct)
-
-		with open(self.inventory_path, 'w') as inv_file:
-			json.dump(inv_list, inv_file, indent=4)
+		dump_json(self.inv_maps, self.inventory_path)
+		self._dirty = False
 
 	def add_to_inventory(self, code: str, source: str, freq: str):
 		self.inv_maps[code] = (source, freq)
-		self.write_updated_inventory()
+		self._dirty = True
+
+	def flush(self):
+		"""
+		write the inventory file if anything has been added since it was last
+		written. additions are only held in memory until then
+		"""
+		if self._dirty:
+			self.write_updated_inventory()
 
 inventory = EdanInventory()
@@ -2,16 +2,27 @@
 parsing & evaluating expressions of series
 """
 
+from __future__ import annotations
+
+import functools
+import re
+import weakref
+from collections import namedtuple
+
 import numpy as np
+import pandas as pd
 
+try:
+	import numexpr
+except ImportError:
+	numexpr = None
 
 
-# basic lexeme object
-class Token(object):
 
-	def __init__(self, token_type, value):
-		self.type = token_type
-		self.value = value
+# basic lexeme object. a namedtuple, so tokens are cheap to create & their
+#	fields are read without an instance dict lookup
+class Token(namedtuple('Token', ['type', 'value'])):
+	__slots__ = ()
 
 	def __repr__(self):
 		return f"Token({self.type}, {self.value})"
@@ -70,25 +81,29 @@ RESERVED_KEYWORDS = {
 
 
 
-# validating functions used by the Lexer
-def is_valid_varchar(c):
-	try:
-		# excl. point is for BEA codes; semis for edan codes
-		return c.isalnum() or c == '!' or c == ':'
-	except AttributeError:
-		return False
-
-def is_valid_varname_start(c):
-	try:
-		return c.isalpha()
-	except AttributeError:
-		return False
-
-def is_valid_numchar(c):
-	try:
-		return c.isdigit()
-	except AttributeError:
-		return False
+# the Lexer matches every token with a single regular expression. the
+#	alternatives are tried in order, so `**` is matched before `*`; any character
+#	that isn't part of a valid token falls through to MISMATCH
+TOKEN_RE = re.compile(
+	r"(?P<WS>\s+)"
+	# excl. point is for BEA codes; semis for edan codes
+	r"|(?P<ID>[A-Za-z][A-Za-z0-9!:]*)"
+	r"|(?P<NUM>\d+(?:\.\d+)?)"
+	r"|(?P<POW>\*\*)"
+	r"|(?P<OP>[-+*/(),])"
+	r"|(?P<MISMATCH>.)",
+	re.DOTALL
+)
+
+OPERATORS = {
+	'*': Token(MUL, '*'),
+	'/': Token(DIV, '/'),
+	'+': Token(PLUS, '+'),
+	'-': Token(MINUS, '-'),
+	'(': Token(LPARE, '('),
+	')': Token(RPARE, ')'),
+	',': Token(COMMA, ',')
+}
 
 
 
@@ -98,117 +113,48 @@ class Lexer(object):
 
 	def __init__(self, text):
 		self.text = text
-
-		self.pos = self.token_pos = 0
-		self.current_char = self.text[self.pos]
+		self.token_pos = 0
 
 		self.tokenize()
 
 	def error(self, char):
 		raise Exception(f"Invalid character: {repr(char)}")
 
-	def advance(self):
-		"""advance the char position and set the new current char"""
-		self.pos += 1
-		try:
-			self.current_char = self.text[self.pos]
-		except IndexError:
-			self.current_char = None
-
-	def peek(self):
-		peek_pos = self.pos + 1
-		try:
-			return self.text[peek_pos]
-		except IndexError:
-			return None
-
-	def _skip_whitespace(self):
-		while self.current_char is not None and self.current_char.isspace():
-			self.advance()
-
-	def _id(self):
-		result = ''
-		while is_valid_varchar(self.current_char):
-			result += self.current_char
-			self.advance()
-		token = RESERVED_KEYWORDS.get(result, Token(ID, result))
-		return token
-
-	def _number(self):
-		result = ''
-		while self.current_char is not None and is_valid_numchar(self.current_char):
-			result += self.current_char
-			self.advance()
-
-		try:
-			token = Token(NUMBER, float(result))
-		except ValueError:
-			# too many decimals
-			raise ValueError(result) from None
-
-		return token
-
-	def next_token(self):
-
-		while self.current_char is not None:
-
-			if self.current_char.isspace():
-				self._skip_whitespace()
-
-			if is_valid_varname_start(self.current_char):
-				return self._id()
-
-			if is_valid_numchar(self.current_char):
-				return self._number()
-
-			if self.current_char == '*' and self.peek() == '*':
-				self.advance()
-				self.advance()
-				return Token(POWER, '**')
-
-			if self.current_char == '*':
-				self.advance()
-				return Token(MUL, '*')
-
-			if self.current_char == '/':
-				self.advance()
-				return Token(DIV, '/')
-
-			if self.current_char == '+':
-				self.advance()
-				return Token(PLUS, '+')
-
-			if self.current_char == '-':
-				self.advance()
-				return Token(MINUS, '-')
-
-			if self.current_char == '(':
-				self.advance()
-				return Token(LPARE, '(')
-
-			if self.current_char == ')':
-				self.advance()
-				return Token(RPARE, ')')
-
-			if self.current_char == ',':
-				self.advance()
-				return Token(COMMA, ',')
-
-			if self.current_char is not None:
-				self.error(self.current_char)
-
 	def tokenize(self):
 		self.token_stream = []
+		append = self.token_stream.append
+
+		# the identifiers that aren't reserved keywords, i.e. the series codes
+		self.id_values = []
+
+		for match in TOKEN_RE.finditer(self.text):
+			kind, value = match.lastgroup, match.group()
+
+			if kind == 'ID':
+				token = RESERVED_KEYWORDS.get(value)
+				if token is None:
+					token = Token(ID, value)
+					self.id_values.append(value)
+				append(token)
+			elif kind == 'NUM':
+				append(Token(NUMBER, float(value)))
+			elif kind == 'POW':
+				append(Token(POWER, value))
+			elif kind == 'OP':
+				append(OPERATORS[value])
+			elif kind == 'MISMATCH':
+				self.error(value)
 
-		while self.current_char is not None:
-			t = self.next_token()
-			if isinstance(t, Token):
-				self.token_stream.append(t)
 		self.token_stream.append(Token(EOF, None))
 
-	def get_next_token(self):
+	def get_next_token(self, advance: bool = True):
+		"""
+		return the next token in the stream. it's consumed unless `advance` is
+		False, in which case the next call returns it again
+		"""
 		token = self.token_stream[self.token_pos]
-		self.token_pos += 1
+		if advance:
+			self.token_pos += 1
 		return token
 
 
@@ -273,7 +219,8 @@ class Parser(object):
 			self.error()
 
 	def peek(self):
-		return self.lexer.get_next_token()
+		"""the token after the current one, without consuming either"""
+		return self.lexer.get_next_token(advance=False)
 
 	def atom(self):
 		token = self.current_token
@@ -292,7 +239,7 @@ class Parser(object):
 			return node
 		elif token.type in (MINUS, PLUS):
 			self.eat(token.type)
-			node = UnaryOp(op=token, expr=self.term())
+			return UnaryOp(op=token, expr=self.term())
 		else:
 			self.error()
 
@@ -351,12 +298,24 @@ class Parser(object):
 # Interpreting & Evaluating section
 class ABCVisitor(object):
 
+	node_types = (Num, Var, UnaryOp, BinaryOp, Function)
+
 	def __init__(self, tree):
 		self.tree = tree
 
+		# the visit_* method of each type of node is looked up once, rather
+		#	than by name every time a node is visited
+		self._dispatch = {
+			node_type: getattr(self, f"visit_{node_type.__name__}")
+			for node_type in self.node_types
+			if hasattr(self, f"visit_{node_type.__name__}")
+		}
+
 	def visit(self, node):
-		method = 'visit_' + type(node).__name__
-		visitor = getattr(self, method, self._nonexistent_node)
+		try:
+			visitor = self._dispatch[type(node)]
+		except KeyError:
+			visitor = self._nonexistent_node
 		return visitor(node)
 
 	def _nonexistent_node(self, node):
@@ -366,98 +325,258 @@ class ABCVisitor(object):
 		return self.visit(self.tree)
 
 
-class CodeLocator(ABCVisitor):
+class CodeCompiler(ABCVisitor):
 	"""
-	find the series identifiers
+	translate an expression into the source of a single python expression
+	that computes it with numpy, where the series are looked up by code in a
+	dictionary `s`. the source is compiled once, so evaluating the expression
+	again doesn't visit each node of the tree. the codes of the series in the
+	expression are collected in the `codes` attribute
+
+	an operation on an array that was itself produced by an earlier operation
+	writes its result into that array, rather than allocating a new one. to do
+	that, each node is visited to a 2-tuple of its source & the kind of value it
+	evaluates to: a number, a series' array (which mustn't be modified), or a
+	temporary array owned by the expression
 	"""
 
+	NUM, VAR, TMP = 'num', 'var', 'tmp'
+
+	functions = {
+		EXP: 'np.exp',
+		LOG: 'np.log',
+		LN: 'np.log',
+		LOG10: 'np.log10',
+		SQRT: 'np.sqrt',
+		ABS: 'np.abs',
+		SIGN: 'np.sign',
+		SIN: 'np.sin',
+		COS: 'np.cos',
+		TAN: 'np.tan',
+		ASIN: 'np.arcsin',
+		ACOS: 'np.arccos',
+		ATAN: 'np.arctan'
+	}
+	operators = {PLUS: '+', MINUS: '-', MUL: '*', DIV: '/', POWER: '**'}
+	ufuncs = {
+		PLUS: 'np.add',
+		MINUS: 'np.subtract',
+		MUL: 'np.multiply',
+		DIV: 'np.true_divide',
+		POWER: 'np.power'
+	}
+
 	def __init__(self, tree):
 		super().__init__(tree)
-		self.codes = set()
+		self.codes = {}
+		self._n_temps = 0
+
+	def _in_place(self, func, args, owned):
+		"""
+		source of calling the ufunc `func` on `args`, writing the result into
+		the temporary array that's the `owned`-th argument
+		"""
+		temp = f"_t{self._n_temps}"
+		self._n_temps += 1
+
+		args = list(args)
+		args[owned] = f"({temp} := {args[owned]})"
+		return f"{func}({', '.join(args)}, out={temp})"
 
 	def visit_Num(self, node):
-		pass
+		return repr(float(node.value)), self.NUM
 
 	def visit_Var(self, node):
-		self.codes.add(node.value)
+		self.codes[node.value] = None
+		return f"s[{repr(node.value)}]", self.VAR
 
 	def visit_UnaryOp(self, node):
-		self.visit(node.expr)
+		expr, kind = self.visit(node.expr)
+		if node.op.type == PLUS:
+			return expr, kind
+
+		if kind == self.TMP:
+			return self._in_place('np.negative', (expr,), 0), kind
+		return f"(-{expr})", kind if kind == self.NUM else self.TMP
 
 	def visit_BinaryOp(self, node):
-		self.visit(node.left)
-		self.visit(node.right)
+		(left, lkind), (right, rkind) = self.visit(node.left), self.visit(node.right)
+		op = node.op.type
+
+		if lkind == self.TMP:
+			return self._in_place(self.ufuncs[op], (left, right), 0), self.TMP
+		if rkind == self.TMP:
+			return self._in_place(self.ufuncs[op], (left, right), 1), self.TMP
+
+		kind = self.NUM if (lkind == rkind == self.NUM) else self.TMP
+		return f"({left} {self.operators[op]} {right})", kind
 
 	def visit_Function(self, node):
-		self.visit(node.expr)
+		func = self.functions[node.value]
+		expr, kind = self.visit(node.expr)
+
+		if kind == self.TMP:
+			return self._in_place(func, (expr,), 0), kind
+		return f"{func}({expr})", kind if kind == self.NUM else self.TMP
+
+	def compile(self):
+		"""
+		return a function of a dictionary of {code: data} that evaluates the
+		expression
+		"""
+		source, _ = self.walk()
+		code = compile(source, '<edan-expr>', 'eval')
+		namespace = {'np': np}
+
+		def evaluate(series: dict):
+			return eval(code, namespace, {'s': series})
+
+		return evaluate
 
 
-class Evaluator(ABCVisitor):
+# {tree: (compiled function, codes)}. like the numexpr forms below, compiled
+#	trees are looked up here rather than compiled again, without modifying the
+#	trees themselves
+_compiled_cache = weakref.WeakKeyDictionary()
+
+def _compiled(tree: AST):
 	"""
-	evaluate an expression with series codes in it
+	the compiled form of `tree`, and the codes of the series it uses. it's
+	built the first time the tree is evaluated, and cached for later evaluations
 	"""
-	def __init__(self, tree, series):
+	try:
+		return _compiled_cache[tree]
+	except KeyError:
+		pass
+
+	compiler = CodeCompiler(tree)
+	compiled = compiler.compile(), tuple(compiler.codes)
+
+	_compiled_cache[tree] = compiled
+	return compiled
+
+
+def _aligned_arrays(series: dict, codes: Iterable[str]):
+	"""
+	pandas aligns series on the union of their indices whenever they're
+	combined arithmetically. aligning them once up front, and evaluating the
+	expression on the underlying arrays, gives the same result without
+	re-aligning at every operation. returns the common index and a dictionary
+	of {code: float ndarray}
+	"""
+	frame = pd.concat([series[code] for code in codes], axis='columns')
+	arrays = {
+		code: frame.iloc[:, i].to_numpy(dtype=float)
+		for i, code in enumerate(codes)
+	}
+	return frame.index, arrays
+
+
+class ExprStringifier(ABCVisitor):
+	"""
+	rebuild an expression as a string that numexpr can evaluate. series codes
+	aren't valid numexpr names, so each one is replaced by a placeholder name;
+	the mapping of {placeholder: code} is stored in the `names` attribute
+	"""
+
+	# functions whose numexpr names differ from the names used in expressions.
+	#	`sign` has no numexpr equivalent that treats NaNs the way numpy does
+	functions = {
+		EXP: 'exp',
+		LOG: 'log',
+		LN: 'log',
+		LOG10: 'log10',
+		SQRT: 'sqrt',
+		ABS: 'abs',
+		SIN: 'sin',
+		COS: 'cos',
+		TAN: 'tan',
+		ASIN: 'arcsin',
+		ACOS: 'arccos',
+		ATAN: 'arctan'
+	}
+	operators = {PLUS: '+', MINUS: '-', MUL: '*', DIV: '/', POWER: '**'}
+
+	def __init__(self, tree):
 		super().__init__(tree)
-		self.series = series
+		self.names = {}
+		self._placeholders = {}
 
 	def visit_Num(self, node):
-		return node.value
+		return repr(float(node.value))
 
 	def visit_Var(self, node):
-		print(node.value)
-		data = self.series[node.value]
-		return data
+		code = node.value
+		try:
+			return self._placeholders[code]
+		except KeyError:
+			name = f"x{len(self._placeholders)}"
+			self._placeholders[code] = name
+			self.names[name] = code
+			return name
 
 	def visit_UnaryOp(self, node):
-		if node.op.type == PLUS:
-			return self.visit(node.expr)
-		elif node.op.type == MINUS:
-			return - self.visit(node.expr)
+		return f"({self.operators[node.op.type]}{self.visit(node.expr)})"
 
 	def visit_BinaryOp(self, node):
-		if node.op.type == PLUS:
-			return self.visit(node.left) + self.visit(node.right)
-		elif node.op.type == MINUS:
-			return self.visit(node.left) - self.visit(node.right)
-		elif node.op.type == MUL:
-			return self.visit(node.left) * self.visit(node.right)
-		elif node.op.type == DIV:
-			return self.visit(node.left) / self.visit(node.right)
-		elif node.op.type == POWERS:
-			return self.visit(node.left) ** self.visit(node.right)
+		left, right = self.visit(node.left), self.visit(node.right)
+		return f"({left} {self.operators[node.op.type]} {right})"
 
 	def visit_Function(self, node):
-		f = node.value
-
-		if f == EXP:
-			return np.exp(self.visit(node.expr))
-		elif (f == LOG) or (f == LN):
-			return np.log(self.visit(node.expr))
-		elif f == LOG10:
-			return np.log10(self.visit(node.expr))
-		elif f == SQRT:
-			return np.sqrt(self.visit(node.expr))
-		elif f == ABS:
-			return np.abs(self.visit(node.expr))
-		elif f == SIGN:
-			return np.sign(self.visit(node.expr))
-		elif f == SIN:
-			return np.sin(self.visit(node.expr))
-		elif f == COS:
-			return np.cos(self.visit(node.expr))
-		elif f == TAN:
-			return np.tan(self.visit(node.expr))
-		elif f == ASIN:
-			return np.arcsin(self.visit(node.expr))
-		elif f == ACOS:
-			return np.arccos(self.visit(node.expr))
-		elif f == ATAN:
-			return np.arctan(self.visit(node.expr))
+		try:
+			func = self.functions[node.value]
+		except KeyError:
+			raise NotImplementedError(
+				f"{repr(node.value)} can't be evaluated by numexpr"
+			) from None
+		return f"{func}({self.visit(node.expr)})"
+
+
+# {tree: (numexpr string, {placeholder: code})}. trees that have already been
+#	stringified are looked up here rather than walked again. None is stored for
+#	trees numexpr can't evaluate
+_numexpr_cache = weakref.WeakKeyDictionary()
+
+def _numexpr_form(tree: AST):
+	try:
+		return _numexpr_cache[tree]
+	except KeyError:
+		pass
+
+	stringifier = ExprStringifier(tree)
+	try:
+		form = stringifier.walk(), stringifier.names
+	except NotImplementedError:
+		form = None
+
+	_numexpr_cache[tree] = form
+	return form
+
+
+def _evaluate_numexpr(tree: AST, series: dict):
+	"""
+	evaluate the expression with numexpr, which computes the whole expression
+	in a single pass over the data. returns None if the expression can't be
+	evaluated that way
+	"""
+	form = _numexpr_form(tree)
+	if (form is None) or (not form[1]):
+		return None
+
+	expr_str, names = form
+
+	index, arrays = _aligned_arrays(series, names.values())
+	local_dict = {name: arrays[code] for name, code in names.items()}
+
+	result = numexpr.evaluate(expr_str, local_dict=local_dict)
+	return pd.Series(result, index=index)
 
 
 
 
 # forward-facing functions
+_OPERATOR_CHARS = frozenset('+-*/)(')
+
 def is_expression(expr: str):
 	"""
 	returns False if `expr` is just a single series code; otherwise returns True
@@ -466,29 +585,31 @@ def is_expression(expr: str):
 	----------
 	expr : str
 	"""
-	ops = r'+-*/)('
-	return any(char in expr for char in ops)
+	return not _OPERATOR_CHARS.isdisjoint(expr)
 
 
+@functools.lru_cache(maxsize=1024)
 def parse_and_extract_series(expr: str):
 	"""
 	translate the expression into an Abstract Syntax Tree and return it, and a
-	set of the series codes that are in it
+	tuple of the series codes that are in it. the results are cached by the
+	expression string; the trees aren't modified once they're built, so the
+	same tree is shared by every evaluation of an expression
 
 	Parameters
 	----------
 	expr: str
 	"""
 	lexer = Lexer(expr)
-	print(lexer.token_stream)
 	parser = Parser(lexer)
 
 	tree = parser.parse()
 
-	locator = CodeLocator(tree)
-	locator.walk()
+	# every identifier the lexer found is a variable in the tree, so the codes
+	#	are read from the lexer rather than by walking the tree
+	codes = tuple(dict.fromkeys(lexer.id_values))
 
-	return tree, list(locator.codes)
+	return tree, codes
 
 
 def evaluate_expr(tree: AST, series: dict):
@@ -502,5 +623,19 @@ def evaluate_expr(tree: AST, series: dict):
 	series : dict
 		dictionary of series
 	"""
-	ev = Evaluator(tree, series)
-	return ev.walk()
+	if numexpr is not None:
+		result = _evaluate_numexpr(tree, series)
+		if result is not None:
+			return result
+
+	func, codes = _compiled(tree)
+	if not codes:
+		# the expression is just numbers
+		return func({})
+
+	index, arrays = _aligned_arrays(series, codes)
+
+	# pandas doesn't warn about division by zero & the like, so neither do we
+	with np.errstate(all='ignore'):
+		result = func(arrays)
+	return pd.Series(result, index=index)
@@ -4,9 +4,11 @@ retrieving data from API sources & storing it in the local data warehouse
 
 from __future__ import annotations
 
+import contextlib
 import json
 import pathlib
 import pandas as pd
+import pyarrow.parquet as pq
 
 from edan.data.inventory import inventory
 from edan.data.fetchers import (
@@ -24,10 +26,38 @@ from edan.data.parsing import (
 warehouse = pathlib.Path(__file__).parent / 'warehouse'
 
 
+def _drop_missing(data: Union[Series, DataFrame]):
+	"""
+	squeeze `data` and drop the observations that are missing. for a Series,
+	this is done with a single boolean mask over its values, rather than the
+	separate passes of `data.squeeze().dropna(how='all', axis='index')`
+
+	Parameters
+	----------
+	data : pandas Series or DataFrame
+
+	Returns
+	-------
+	pandas Series or DataFrame
+	"""
+	if isinstance(data, pd.DataFrame):
+		data = data.squeeze(axis='columns')
+		if isinstance(data, pd.DataFrame):
+			return data.dropna(how='all', axis='index')
+
+	values = data.to_numpy()
+	mask = pd.notna(values)
+	return pd.Series(values[mask], index=data.index[mask], name=data.name)
+
+
 class EdanDataRetriever(object):
 
 	def __init__(self):
-		pass
+		# {code: (data, metadata)} of the series read from the warehouse
+		self._warehouse_cache = {}
+
+		# how many calls deep in `_batched_inventory` the retriever is
+		self._batch_depth = 0
 
 	def retrieve(
 		self,
@@ -68,17 +98,21 @@ class EdanDataRetriever(object):
 		if is_expression(code):
 			tree, code_list = parse_and_extract_series(code)
 
-			# collect data & metadata before evaluating
-			series, frames = {}, []
-			for c in code_list:
-				data, meta = self.retrieve_series(c, source, *init_args, **init_kwargs)
+			# collect data & metadata of every series before evaluating. they're
+			#	retrieved together so stored series that share a file are read
+			#	from it once
+			retrieved = self.retrieve_many(
+				code_list, source, *init_args, **init_kwargs
+			)
 
-				series[data.name] = data
+			series, frames = {}, []
+			for c, (data, meta) in zip(code_list, retrieved):
+				series[c] = data
 				frames.append(meta)
 
 			df = evaluate_expr(tree, series)
 			metadata = pd.concat(frames, axis='columns')
-			return df.squeeze().dropna(how='all', axis='index'), metadata.squeeze()
+			return _drop_missing(df), metadata.squeeze()
 
 		else:
 			return self.retrieve_series(code, source, *init_args, **init_kwargs)
@@ -130,12 +164,7 @@ class EdanDataRetriever(object):
 			return self.retrieve_from_warehouse(code)
 
 		# retrieve the 'official' identifier in case this code is an alias
-		fm = alias_maps[source]
-		try:
-			code = fm[code]
-		except KeyError:
-			# `code` might be a code I haven't constructed a crosswalk for
-			pass
+		code = self.translate_alias(code, source)
 
 		# retrieving stored data or fetching from API
 		if code in inventory:
@@ -152,11 +181,130 @@ class EdanDataRetriever(object):
 
 			data, meta = fetcher.fetch(code)
 			self.save_fetched_info_to_warehouse(data, meta)
-			return data.squeeze().dropna(how='all', axis='index'), meta
+			return _drop_missing(data), meta
 
 		raise NotImplementedError("cannot retrieve without `source` yet")
 
 
+	def retrieve_many(
+		self,
+		codes: Iterable[str],
+		source: str = '',
+		*init_args, **init_kwargs
+	):
+		"""
+		retrieve and return the economic data and metadata of several series at
+		once. series in the warehouse that are stored in files shared by every
+		series of a source & frequency (as older versions stored them) are grouped
+		by file, and each of those files is read a single time for all the
+		requested columns, rather than once per series. series that aren't stored
+		yet are fetched from the source API one at a time
+
+		Parameters
+		----------
+		codes : Iterable[str]
+			the codes referencing the desired series. the alias maps are checked
+			in case any of the provided codes are aliases
+		source : str ( = '' )
+			the source api that hosts the series' data & metadata
+		*init_args : positional arguments
+			initialization arguments in case the source API key is not saved
+		*init_kwargs : keyword arguments
+			initialization arguments in case the source API key is not saved
+
+		Returns
+		-------
+		list of 2-tuples of pandas objects
+			(data, metadata) of each code, in the order of `codes`
+		"""
+		codes = list(codes)
+
+		# {(source, freq): [(code, stored_code), ...]} of the series stored in the
+		#	files shared by every series of a source & frequency
+		retrieved, stored = {}, {}
+		# series fetched from their APIs are added to the inventory file once,
+		#	after all of them have been saved
+		with self._batched_inventory():
+			for code in codes:
+				if code in retrieved:
+					continue
+
+				if is_expression(code):
+					retrieved[code] = self.retrieve(
+						code, source, *init_args, **init_kwargs
+					)
+					continue
+
+				stored_code = code
+				if stored_code not in inventory:
+					stored_code = self.translate_alias(code, source)
+
+				if stored_code in inventory:
+					src, freq = inventory[stored_code]
+					data_path, _ = self.series_paths(stored_code, src, freq)
+
+					if data_path.exists():
+						# series with their own files are read individually
+						retrieved[code] = self.retrieve_from_warehouse(stored_code)
+					else:
+						group = stored.setdefault((src, freq), [])
+						group.append((code, stored_code))
+				else:
+					retrieved[code] = self.retrieve_series(
+						code, source, *init_args, **init_kwargs
+					)
+
+		for (src, freq), group in stored.items():
+			columns = list(dict.fromkeys(sc for _, sc in group))
+
+			path = warehouse / src / f'{freq}.parquet'
+			data = self.load_parquet(path, columns=columns)
+			data.index = pd.to_datetime(data.index)
+
+			path = warehouse / src / 'metadata.parquet'
+			meta = self.load_parquet(path, columns=columns)
+
+			for code, sc in group:
+				retrieved[code] = (
+					_drop_missing(data[sc]),
+					meta[[sc]]
+				)
+
+		return [retrieved[code] for code in codes]
+
+	@contextlib.contextmanager
+	def _batched_inventory(self):
+		"""
+		hold the inventory additions of series saved inside this context in
+		memory, and write them to the inventory file when it's exited
+		"""
+		self._batch_depth += 1
+		try:
+			yield
+		finally:
+			self._batch_depth -= 1
+			if not self._batch_depth:
+				inventory.flush()
+
+	def translate_alias(self, code: str, source: str = ''):
+		"""
+		return the 'official' identifier of `code` from the alias maps of the
+		`source` api. if `code` isn't a recognized alias, or `source` has no alias
+		map (e.g. it isn't given), it is returned as-is
+
+		Parameters
+		----------
+		code : str
+			the code referencing the desired series
+		source : str ( = '' )
+			the source api whose identifiers `code` is translated to
+		"""
+		try:
+			return alias_maps[source][code]
+		except KeyError:
+			# `code` might be a code I haven't constructed a crosswalk for
+			return code
+
 	def retrieve_from_warehouse(self, code: str):
 		"""
 		retrieve & return the economic & meta data from the parquet files
@@ -167,19 +315,59 @@ class EdanDataRetriever(object):
 		code : str
 			data series identifier
 		"""
+		data, meta = self._read_from_warehouse(code)
+		return _drop_missing(data), meta.copy()
+
+	def _read_from_warehouse(self, code: str):
+		"""
+		read the economic & meta data of `code` from the parquet files in the
+		warehouse. the frames are cached by code, so repeated requests don't
+		read the files again; a code is evicted when its series is saved again.
+		the cached frames are shared, so callers should only return copies of them
+		"""
+		try:
+			return self._warehouse_cache[code]
+		except KeyError:
+			pass
+
 		# retrieving data source & frequency
 		source, freq = inventory[code]
 
+		data_path, meta_path = self.series_paths(code, source, freq)
+		if not data_path.exists():
+			# series saved by older versions are columns in files shared by
+			#	every series of the same source & frequency
+			data_path = warehouse / source / f'{freq}.parquet'
+			meta_path = warehouse / source / 'metadata.parquet'
+
 		# the datetime index is stored as a string (requirement of parquet)
 		#	so we cast to datetime  here
-		path = warehouse / source / f'{freq}.parquet'
-		data = self.load_parquet(path, columns=[code])
+		data = self.load_parquet_column(data_path, code)
 		data.index = pd.to_datetime(data.index)
 
-		path = warehouse / source / 'metadata.parquet'
-		meta = self.load_parquet(path, columns=[code])
+		meta = self.load_parquet_column(meta_path, code).to_frame()
+
+		self._warehouse_cache[code] = data, meta
+		return data, meta
 
-		return data.squeeze().dropna(how='all', axis='index'), meta
+	def series_paths(self, code: str, source: str, freq: str):
+		"""
+		return the paths of the parquet files that store the economic data &
+		metadata of a single series. the data of each source is stored in a
+		directory for each frequency, and its metadata in a 'metadata' directory
+
+		Parameters
+		----------
+		code : str
+			data series identifier
+		source : str
+			the source api of the series
+		freq : str
+			the frequency of the series
+		"""
+		source_dir = warehouse / source
+		file_name = f'{code}.parquet'
+		return source_dir / freq / file_name, source_dir / 'metadata' / file_name
 
 	def retrieve_data(
 		self,
@@ -188,7 +376,7 @@ class EdanDataRetriever(object):
 		*init_args, **init_kwargs
 	):
 		data, meta = self.retrieve(code, source, *init_args, **init_kwargs)
-		return data.squeeze().dropna(axis='index', how='all')
+		return data
 
 	def retrieve_metadata(
 		self,
@@ -227,30 +415,21 @@ class EdanDataRetriever(object):
 		source = meta.loc['source']
 		freq = meta.loc['frequency'].lower()
 
-		# saving the economic data
-		data_path = warehouse / source / f'{freq}.parquet'
-		old_data = self.load_parquet(data_path)
-		if old_data is None:
-			# first data series of this frequency
-			self.write_parquet(data, data_path)
-
-		else:
-			df = pd.concat((old_data, data), axis='columns')
-			self.write_parquet(df, data_path)
-
-		# saving the metadata
-		meta_path = warehouse / source / 'metadata.parquet'
-		old_meta = self.load_parquet(meta_path)
-		if old_meta is None:
-			# first data series of this source
-			self.write_parquet(meta, meta_path)
+		# each series is saved to its own files, so saving a new series doesn't
+		#	require reading & re-writing the series that are already stored
+		data_path, meta_path = self.series_paths(code, source, freq)
+		data_path.parent.mkdir(parents=True, exist_ok=True)
+		meta_path.parent.mkdir(parents=True, exist_ok=True)
 
-		else:
-			df = pd.concat((old_meta, meta), axis='columns')
-			self.write_parquet(df, meta_path)
+		self.write_parquet(data, data_path)
+		self.write_parquet(meta, meta_path)
+		self._warehouse_cache.pop(code, None)
 
-		# record data series info for future accessing
+		# record data series info for future accessing. the inventory file is
+		#	written right away, unless several series are being saved together
 		inventory.add_to_inventory(code, source, freq)
+		if not self._batch_depth:
+			inventory.flush()
 
 	def write_parquet(
 		self,
@@ -289,4 +468,42 @@ class EdanDataRetriever(object):
 		else:
 			return None
 
+	def load_parquet_column(self, file_path: Union[str, Path], column: str):
+		"""
+		read a single column of a parquet file that may or may not exist yet.
+		the column & its index are read as arrow arrays and put directly into a
+		pandas Series, skipping the construction of a DataFrame
+
+		Parameters
+		----------
+		file_path : str or path-like
+		column : str
+			name of the column to read
+		"""
+		if isinstance(file_path, str):
+			file_path = pathlib.Path(file_path)
+
+		if not file_path.exists():
+			return None
+
+		table = pq.read_table(file_path, columns=[column], use_pandas_metadata=True)
+
+		pandas_meta = table.schema.pandas_metadata or {}
+		index_columns = pandas_meta.get('index_columns', [])
+		if (len(index_columns) != 1) or not isinstance(index_columns[0], str):
+			# range & multi-level indices are left for pandas to reconstruct
+			return table.to_pandas()[column]
+
+		# the index is stored in a column whose name might not be the name of
+		#	the index itself (e.g. '__index_level_0__' for unnamed indices)
+		field = index_columns[0]
+		name = next(
+			(c['name'] for c in pandas_meta['columns'] if c['field_name'] == field),
+			None
+		)
+
+		index = pd.Index(table.column(field).to_numpy(), name=name)
+		values = table.column(column).to_numpy()
+		return pd.Series(values, index=index, name=column)
+
 retriever = EdanDataRetriever()
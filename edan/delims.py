@@ -4,13 +4,26 @@ tools for working with the `edan` delimiters & hierarchical codes
 
 from __future__ import annotations
 
+import functools
 import re
 from itertools import cycle
 
-from rich import print
-
 edan_delimiters = (':', '~')
 delim_pattern = '|'.join(map(re.escape, edan_delimiters))
+_delimiter_set = frozenset(edan_delimiters)
+
+# splitting on a captured pattern keeps the delimiters, so a single split of a
+#	code gives its ids & delimiters interleaved
+_DELIM_RE = re.compile(f"({delim_pattern})")
+
+
+@functools.lru_cache(maxsize=4096)
+def _split_code(code: str):
+	"""
+	the ids & delimiters of `code`, in the order they appear. codes are split
+	over & over again when comparing & concatenating them, so they're cached
+	"""
+	return tuple(_DELIM_RE.split(code))
 
 
 class EdanCode(object):
@@ -21,20 +34,21 @@ class EdanCode(object):
 		else:
 			self.code = code
 
-		ids = re.split(delim_pattern, code)
-		delims = re.findall(delim_pattern, code)
+		elements = _split_code(self.code)
+		self.elements = list(elements)
 
-		self.elements = [None]*(len(ids) + len(delims))
-		self.elements[::2] = ids
-		self.elements[1::2] = delims
+		# ids & delimiters are separated once, so they aren't sliced out of the
+		#	elements every time they're accessed
+		self._ids = elements[::2]
+		self._delims = elements[1::2]
 
 	@property
 	def ids(self):
-		return self.elements[::2]
+		return self._ids
 
 	@property
 	def delims(self):
-		return self.elements[1::2]
+		return self._delims
 
 	def __repr__(self):
 		return f"EdanCode({self.code})"
@@ -47,31 +61,38 @@ class EdanCode(object):
 
 	def __getitem__(self, key):
 		if isinstance(key, int):
-			if key >= 0:
-				return self.elements[2*key]
-			else:
-				return self.elements[2*key+1]
+			return self._ids[key]
 
 		elif isinstance(key, slice):
-			if (key.stop is None) and (key.start is None):
-				elms = self.elements[slice(None, None, key.step)]
+			start, stop, step = key.start, key.stop, key.step
 
-			elif key.stop is None:
-				b = 1 if key.start < 0 else 0
-				elms = self.elements[slice(2*key.start+b, None, key.step)]
+			# translate the bounds on ids into bounds on the elements, which
+			#	alternate between ids & delimiters. the slice of elements is
+			#	joined once, directly into the code-like string
+			if start is not None:
+				start = 2*start + 1 if start < 0 else 2*start
+			if stop is not None:
+				stop = 2*stop if stop <= 0 else 2*stop - 1
 
-			elif key.start is None:
-				e = 0 if key.stop <= 0 else -1
-				elms = self.elements[slice(None, 2*key.stop+e, key.step)]
+			if (start is None) and (stop is None) and (step is None):
+				return self.code
+			return ''.join(self.elements[start:stop:step])
 
-			else:
-				b = 1 if key.start < 0 else 0
-				e = 0 if key.stop <= 0 else -1
-				elms = self.elements[slice(2*key.start+b, 2*key.stop+e, key.step)]
+		raise TypeError(f"{repr(key)}. EdanCode key can only be `int` or `slice`")
 
-			return ''.join(elms)
 
-		raise TypeError(f"{repr(key)}. EdanCode key can only be `int` or `slice`")
+@functools.lru_cache(maxsize=2048)
+def _cached_code(code: str):
+	"""
+	EdanCode of the string `code`. EdanCodes aren't modified once they're made,
+	so the ones compared & concatenated by the functions below are shared
+	"""
+	return EdanCode(code)
+
+def _edan_code(code: Union[str, EdanCode]):
+	if isinstance(code, str):
+		return _cached_code(code)
+	return EdanCode(code)
 
 
 def contains(parent: str, child: str):
@@ -80,7 +101,15 @@ def contains(parent: str, child: str):
 	EdanCode `parent`
 	"""
 
-	parent, child = EdanCode(parent), EdanCode(child)
+	if isinstance(parent, str) and isinstance(child, str):
+		# ids don't contain delimiters, so `child` descends from `parent` exactly
+		#	when it starts with `parent` and continues, if at all, with a delimiter
+		if not child.startswith(parent):
+			return False
+		n = len(parent)
+		return (len(child) == n) or (child[n] in _delimiter_set)
+
+	parent, child = _edan_code(parent), _edan_code(child)
 
 	base_level, child_level = len(parent), len(child)
 	if base_level > child_level:
@@ -93,6 +122,30 @@ def contains(parent: str, child: str):
 	return str(parent) == child_base
 
 
+def _overlap(code_elms: list, other_elms: list):
+	"""
+	the number of elements in the longest run of ids & delimiters that both ends
+	`code_elms` and begins `other_elms`. it's read from the last entry of the
+	failure function of the Knuth-Morris-Pratt algorithm over the elements of
+	`other_elms`, then those of `code_elms`, so each element is compared a
+	constant number of times. ids are never equal to delimiters, so the run
+	always begins & ends with an id
+	"""
+	# `None` separates the sequences so the run can't be longer than either
+	seq = [*other_elms, None, *code_elms]
+
+	failure = [0] * len(seq)
+	k = 0
+	for j in range(1, len(seq)):
+		while k and (seq[j] != seq[k]):
+			k = failure[k-1]
+		if seq[j] == seq[k]:
+			k += 1
+		failure[j] = k
+
+	return failure[-1]
+
+
 def concat_codes(code: str, other: str, delim: str = ':'):
 	"""
 	concatenate two possibly overlapping `edan` code-like strings to produce a
@@ -114,16 +167,12 @@ def concat_codes(code: str, other: str, delim: str = ':'):
 	if contains(code, other):
 		return other
 
-	code, other = EdanCode(code), EdanCode(other)
-	n_overlaps = max(len(code.ids), len(other.ids))
-
-	for i in range(1, n_overlaps+1):
-		if code[-i:] == other[:i]:
-
-			base = code[:i]
-			addition = other[(i-1):]
+	code_elms = _edan_code(code).elements
+	other_elms = _edan_code(other).elements
 
-			return base + code.delims[-1] + addition
+	overlap = _overlap(code_elms, other_elms)
+	if overlap:
+		return str(code) + ''.join(other_elms[overlap:])
 
 	if delim not in edan_delimiters:
 		raise ValueError(f"{repr(delim)} is not a recognized edan delimiter")
@@ -4,6 +4,9 @@ accessing underlying pandas Series and DataFrames of edan data objects
 
 from __future__ import annotations
 
+import itertools
+
+import numpy as np
 import pandas as pd
 
 class _GenericIndexer(object):
@@ -12,7 +15,12 @@ class _GenericIndexer(object):
 		self.name = name
 		self.obj = obj
 
-	def concat(self, objs):
+	@staticmethod
+	def concat(objs, columns: list = None):
+		"""
+		concatenate the data of each field into the columns of a DataFrame. if
+		`columns` isn't provided, they're named the way `pd.concat` names them
+		"""
 
 		series = []
 		for o in objs:
@@ -22,7 +30,54 @@ class _GenericIndexer(object):
 			else:
 				series.append(o)
 
-		return pd.concat(series, axis='columns', join='outer')
+		if len(series) == 1:
+			# there's nothing to align a single object with. it's copied, like
+			#	`pd.concat` would, so the frame doesn't share the field's data
+			obj = series[0]
+			if isinstance(obj, pd.Series):
+				df = obj.to_frame().copy()
+			else:
+				df = obj.copy()
+
+			if columns is not None:
+				df.columns = columns
+			return df
+
+		first = series[0]
+		if all(
+			isinstance(s, pd.Series) and (s.dtype == first.dtype) and
+			((s.index is first.index) or s.index.equals(first.index)) and
+			(s.index.dtype == first.index.dtype)
+			for s in series
+		):
+			# series with the same index & dtype don't need to be aligned, so
+			#	their values are stacked directly into a single block
+			if columns is None:
+				unnamed = itertools.count()
+				columns = [next(unnamed) if s.name is None else s.name for s in series]
+
+			values = np.column_stack([s.to_numpy() for s in series])
+			return pd.DataFrame(values, index=first.index, columns=columns)
+
+		if (columns is not None) and all(isinstance(s, pd.Series) for s in series):
+			# the columns of concatenated Series are labeled by `keys`
+			return pd.concat(series, axis='columns', join='outer', keys=columns)
+
+		df = pd.concat(series, axis='columns', join='outer')
+		if columns is not None:
+			df.columns = columns
+		return df
+
+
+
+def _detach(obj):
+	"""
+	copy the selections of pandas objects, which can be views of the cached
+	DataFrame, so writing to them doesn't change the data of later selections
+	"""
+	if isinstance(obj, (pd.Series, pd.DataFrame)):
+		return obj.copy()
+	return obj
 
 
 
@@ -31,12 +86,7 @@ class _iLocIndexer(_GenericIndexer):
 	accessing data in underlying fields by index locations
 	"""
 	def __getitem__(self, key):
-
-		data = [getattr(self.obj, f).data for f in self.obj.fields]
-
-		df = self.concat(data)
-		df.columns = self.obj.fields
-		return df.iloc[key]
+		return _detach(self.obj._build_df().iloc[key])
 
 
 
@@ -45,11 +95,7 @@ class _LocIndexer(_GenericIndexer):
 	accessing data in underlying fields by index keys
 	"""
 	def __getitem__(self, key):
-		data = [getattr(self.obj, f).data for f in self.obj.fields]
-
-		df = self.concat(data)
-		df.columns = self.obj.fields
-		return df.loc[key]
+		return _detach(self.obj._build_df().loc[key])
 
 
 
@@ -64,6 +110,32 @@ class CompoundAccessor(object):
 	def __init__(self, fields):
 		self.fields = fields
 
+		# 2-tuple of the `data_version` of each field & the DataFrame
+		#	concatenated from their data
+		self._df_cache = None
+
+	def _build_df(self):
+		"""
+		return a DataFrame with the data of each field in its columns. the
+		concatenation is cached, and only redone if the `data_version` of a
+		field has been bumped since the last time it was built, i.e. if its data
+		has been replaced or handed out to be possibly modified. the frame is
+		built from copies of the data, and it's shared, so it shouldn't be
+		handed out without copying it
+		"""
+		objs = [getattr(self, f) for f in self.fields]
+		versions = tuple(o.data_version for o in objs)
+
+		cache = self._df_cache
+		if (cache is not None) and (cache[0] == versions):
+			return cache[1]
+
+		df = _GenericIndexer.concat([o.data for o in objs], columns=self.fields)
+
+		# reading the data bumps the versions, so they're recorded afterwards
+		self._df_cache = (tuple(o.data_version for o in objs), df)
+		return df
+
 	@property
 	def iloc(self):
 		return _iLocIndexer('iloc', self)
@@ -9,8 +9,6 @@ import numpy as np
 
 from edan.core.base import BaseComponent
 
-from rich import print
-
 
 __all__ = [
 	'paasche',
@@ -51,10 +51,19 @@ def aggregate_nipa(
 	if any(isinstance(o, (FlowComponent, BalanceComponent)) for o in objs):
 		raise NotImplementedError("cannot aggregate Flow- or BalanceComponents now")
 
-	# nominal level is just sum of sub-components
-	nom_frames = [comp.nominal.data for comp in objs]
-	nom_data = pd.concat(nom_frames, axis='columns').dropna(axis='index', how='all')
-	nominal = nom_data.sum(axis='columns')
+	# the data of every component is retrieved together, so series stored in
+	#	the same warehouse file are read from it once
+	for mtype in ('nominal', 'real', 'price'):
+		NIPAComponent.load_series(objs, mtype)
+
+	# nominal level is just sum of sub-components, skipping missing values.
+	#	periods where every sub-component is missing are dropped
+	nom_arr, nom_index = _stack_components(objs, 'nominal')
+	observed = ~np.isnan(nom_arr).all(axis=1)
+	nominal = pd.Series(
+		np.nansum(nom_arr[observed], axis=1),
+		index=nom_index[observed]
+	)
 
 	# use chain-weighting to compute the real level, then compute implied price
 	#	and quantity indices
@@ -92,6 +101,35 @@ def aggregate_nipa(
 
 
 
+def _stack_components(objs: Iterable[NIPAComponent], mtype: str):
+	"""
+	stack the `mtype` data of each component as the columns of a 2-D float
+	array. when every series shares an index they're stacked directly;
+	otherwise pandas aligns them on the union of their indices
+
+	Parameters
+	----------
+	objs : Iterable[NIPAComponent]
+		the components whose data is stacked
+	mtype : str
+		the measure type of the data to stack
+
+	Returns
+	-------
+	tuple of numpy ndarray & pandas Index
+	"""
+	frames = [getattr(comp, mtype).data for comp in objs]
+
+	index = frames[0].index
+	if all(f.index.equals(index) for f in frames[1:]):
+		arr = np.column_stack([f.to_numpy(dtype=np.float64) for f in frames])
+	else:
+		data = pd.concat(frames, axis='columns')
+		index, arr = data.index, data.to_numpy(dtype=np.float64)
+
+	return arr, index
+
+
 def compute_real_level(objs: Iterable[NIPAComponent]):
 	chain = ChainWeighter(objs)
 	return chain.compute()
@@ -164,8 +202,21 @@ class ChainWeighter(object):
 				add_idx(comp, idx)
 				idx += 1
 
-		# let pandas handle joining & nans
-		data = pd.concat(rdata + pdata, axis='columns').dropna(axis='index')
+		# when every series shares an index they're stacked directly & periods
+		#	with any missing value are masked out. otherwise let pandas handle
+		#	joining & nans
+		frames = rdata + pdata
+		index = frames[0].index
+		if all(f.index.equals(index) for f in frames[1:]):
+			arr = np.column_stack([f.to_numpy(dtype=np.float64) for f in frames])
+			complete = ~np.isnan(arr).any(axis=1)
+			data = pd.DataFrame(
+				arr[complete],
+				index=index[complete],
+				columns=[f.name for f in frames]
+			)
+		else:
+			data = pd.concat(frames, axis='columns').dropna(axis='index')
 
 		# re-partition data
 		n_series = len(rdata)
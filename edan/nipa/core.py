@@ -22,9 +22,6 @@ from edan.nipa.features import (
 
 class NIPASeries(Series):
 
-	def __init__(self, *args, **kwargs):
-		super().__init__(*args, **kwargs)
-
 	# add accessor for functions of data
 	transform = CachedAccessor('transform', TransformationAccessor)
 
@@ -11,7 +11,6 @@ from edan.core.base import (
 )
 
 from edan.accessors import CachedAccessor
-from edan.plotting.scenarios import ForecastPlotAccessor
 
 from edan.utils.ts import (
 	infer_freq,
@@ -87,7 +86,7 @@ class Forecast(BaseForecast):
 			return pd.DataFrame(arr, index=idx, columns=self.forecast.columns)
 
 	# accessor for plotting
-	plot = CachedAccessor('plot', ForecastPlotAccessor)
+	plot = CachedAccessor('plot', 'edan.plotting.scenarios.ForecastPlotAccessor')
 
 
 
@@ -0,0 +1,66 @@
+"""
+reading & writing the JSON files that edan stores on disk. orjson is used to
+parse them when it's installed, and the standard library's json module otherwise
+"""
+
+from __future__ import annotations
+
+import json
+
+try:
+	import orjson
+except ImportError:
+	orjson = None
+
+
+def loads_json(data: Union[bytes, str]):
+	"""
+	parse a JSON document
+
+	Parameters
+	----------
+	data : bytes | str
+		the JSON document
+
+	Returns
+	-------
+	the parsed object
+	"""
+	if orjson is None:
+		return json.loads(data)
+	return orjson.loads(data)
+
+
+def load_json(path: Union[str, pathlib.Path]):
+	"""
+	parse the JSON file at `path`. an empty file raises a JSONDecodeError with
+	either library (orjson's error subclasses the standard library's)
+
+	Parameters
+	----------
+	path : str | pathlib.Path
+		location of the JSON file
+
+	Returns
+	-------
+	the parsed object
+	"""
+	with open(path, 'rb') as json_file:
+		return loads_json(json_file.read())
+
+
+def dump_json(obj, path: Union[str, pathlib.Path]):
+	"""
+	write `obj` to the file at `path` as JSON indented by four spaces. this is
+	always done with the standard library, since orjson can only indent by two
+	spaces & the files are written far less often than they're read
+
+	Parameters
+	----------
+	obj : JSON-serializable object
+		the object to write
+	path : str | pathlib.Path
+		location of the JSON file
+	"""
+	with open(path, 'w') as json_file:
+		json.dump(obj, json_file, indent=4)
@@ -0,0 +1,121 @@
+"""
+testing the construction of Components from registry entries
+"""
+
+import copy
+import unittest
+
+from edan.algos import construct_forest
+from edan.core.components import Component
+from edan.core.disaggregate import collect_elemental
+
+
+class MeasuredComponent(Component):
+	mtypes = ['real', 'price']
+
+
+entries = [
+	{
+		'code': 'a', '__level__': 0, 'long_name': 'aggregate', 'short_name': 'agg',
+		'source': 'bea', '__table__': 't1', 'real': 'ra', 'price': 'pa'
+	},
+	{
+		'code': 'a:b', '__level__': 1, 'long_name': 'sub', 'short_name': '',
+		'source': 'bea', '__table__': 't1', 'real': 'rb'
+	},
+	{
+		'code': 'a~c', '__level__': 1, 'long_name': 'less', 'short_name': '',
+		'source': 'bea', '__table__': 't1', 'real': 'rc', 'price': ''
+	}
+]
+
+
+class TestFromRegistry(unittest.TestCase):
+
+	def test_many_matches_single(self):
+		many = MeasuredComponent.from_registry_many(entries)
+		single = [MeasuredComponent.from_registry(e) for e in entries]
+
+		for m, s in zip(many, single):
+			with self.subTest(code=s.code):
+				self.assertIs(type(m), type(s))
+
+				# every Component has its own tree version counter
+				m_state, s_state = vars(m).copy(), vars(s).copy()
+				m_tree, s_tree = m_state.pop('_tree'), s_state.pop('_tree')
+				self.assertEqual(m_state, s_state)
+				self.assertEqual(
+					(m_tree.value, m_tree.merged), (s_tree.value, s_tree.merged)
+				)
+
+
+class TestSubtreeCaches(unittest.TestCase):
+
+	def setUp(self):
+		self.comps = MeasuredComponent.from_registry_many(entries)
+		construct_forest(self.comps, level='level', lower='subs')
+		self.agg, self.sub, _ = self.comps
+
+	def test_descendant_append(self):
+		# build the caches of the aggregate before changing a descendant
+		self.assertEqual(
+			[c.code for c in collect_elemental(self.agg)], ['a:b', 'a~c']
+		)
+
+		new = MeasuredComponent.from_registry({
+			'code': 'a:b:d', '__level__': 2, 'long_name': '', 'short_name': '',
+			'source': 'bea', '__table__': 't1', 'real': 'rd'
+		})
+		self.sub.subs.append(new)
+
+		self.assertEqual(
+			[c.code for c in collect_elemental(self.agg)], ['a:b:d', 'a~c']
+		)
+		self.assertIs(self.agg.disaggregate('b:d').disaggregates[0], new)
+
+	def test_descendant_reassign(self):
+		self.assertEqual(
+			[c.code for c in collect_elemental(self.agg)], ['a:b', 'a~c']
+		)
+
+		new = MeasuredComponent.from_registry({
+			'code': 'a:b:e', '__level__': 2, 'long_name': '', 'short_name': '',
+			'source': 'bea', '__table__': 't1', 'real': 're'
+		})
+		self.sub.subs = [new]
+
+		self.assertIs(self.agg.disaggregate('a:b:e').disaggregates[0], new)
+
+	def test_other_tree_unaffected(self):
+		other = MeasuredComponent.from_registry_many([
+			dict(e, code=e['code'].replace('a', 'z', 1)) for e in entries
+		])
+		construct_forest(other, level='level', lower='subs')
+
+		collect_elemental(self.agg)
+		cached = self.agg._subtree_arrays
+
+		other[1].subs.append(MeasuredComponent('z:b:d', level=2, source='bea'))
+		other[0].subs.sort(key=lambda c: c.code, reverse=True)
+
+		collect_elemental(self.agg)
+		self.assertIs(self.agg._subtree_arrays, cached)
+
+	def test_deepcopy(self):
+		collect_elemental(self.agg)
+		agg = copy.deepcopy(self.agg)
+		sub = agg.subs[0]
+
+		new = MeasuredComponent('a:b:d', level=2, source='bea')
+		sub.subs.append(new)
+
+		self.assertEqual(
+			[c.code for c in collect_elemental(agg)], ['a:b:d', 'a~c']
+		)
+		self.assertEqual(
+			[c.code for c in collect_elemental(self.agg)], ['a:b', 'a~c']
+		)
+
+
+if __name__ == '__main__':
+	unittest.main()
@@ -95,6 +95,16 @@ class TestDelimMethods(unittest.TestCase):
 		child = 'a:b:c-d'
 		self.assertEqual(concat_codes(parent, child), 'a:b:c-d')
 
+	def test_concat_deep_overlap(self):
+		parent = 'a:b:c'
+		child = 'c:d'
+		self.assertEqual(concat_codes(parent, child), 'a:b:c:d')
+
+	def test_concat_longest_overlap(self):
+		parent = 'a:b:b'
+		child = 'b:b:c'
+		self.assertEqual(concat_codes(parent, child), 'a:b:b:c')
+
 	def test_concat_bad_delimiter(self):
 		parent = 'a:b'
 		child = 'c-d'
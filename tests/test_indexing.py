@@ -0,0 +1,79 @@
+"""
+testing the `.loc` & `.iloc` accessors of objects with data in several fields
+"""
+
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from edan.core.series import Series
+from edan.indexing import CompoundAccessor
+
+
+index = pd.date_range(end='1/1/2021', periods=4, freq='q')
+
+
+class Pair(CompoundAccessor):
+
+	def __init__(self, a, b):
+		super().__init__(fields=['a', 'b'])
+		self.a = Series('a', data=a)
+		self.b = Series('b', data=b)
+
+
+class TestCompoundAccessor(unittest.TestCase):
+
+	def setUp(self):
+		self.pair = Pair(
+			pd.Series([1.0, 2.0, 3.0, 4.0], index=index),
+			pd.Series([5.0, 6.0, 7.0, 8.0], index=index)
+		)
+
+	def expected(self):
+		return pd.DataFrame(
+			{'a': [1.0, 2.0, 3.0, 4.0], 'b': [5.0, 6.0, 7.0, 8.0]},
+			index=index
+		)
+
+	def test_loc_iloc(self):
+		expected = self.expected()
+		pd.testing.assert_frame_equal(self.pair.loc[:], expected)
+		pd.testing.assert_frame_equal(self.pair.iloc[1:3], expected.iloc[1:3])
+		pd.testing.assert_series_equal(self.pair.loc[:, 'b'], expected['b'])
+		self.assertEqual(self.pair.iloc[2, 0], 3.0)
+
+	def test_frame_reused(self):
+		self.pair.loc[:]
+		df = self.pair._df_cache[1]
+		self.pair.iloc[0:2]
+		self.assertIs(self.pair._df_cache[1], df)
+
+	def test_selection_writes_not_shared(self):
+		sliced = self.pair.iloc[0:2]
+		sliced.iloc[0, 0] = 99.0
+		column = self.pair.loc[:, 'a']
+		column.iloc[1] = 99.0
+
+		pd.testing.assert_frame_equal(self.pair.loc[:], self.expected())
+		self.assertEqual(self.pair.a.data.iloc[0], 1.0)
+
+	def test_field_modified_in_place(self):
+		self.pair.loc[:]
+		self.pair.a.data.iloc[1] = -1.0
+
+		expected = self.expected()
+		expected.iloc[1, 0] = -1.0
+		pd.testing.assert_frame_equal(self.pair.loc[:], expected)
+
+	def test_field_replaced(self):
+		self.pair.iloc[:]
+		self.pair.b.data = pd.Series(np.zeros(4), index=index)
+
+		expected = self.expected()
+		expected['b'] = 0.0
+		pd.testing.assert_frame_equal(self.pair.iloc[:], expected)
+
+
+if __name__ == '__main__':
+	unittest.main()
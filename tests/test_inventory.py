@@ -0,0 +1,83 @@
+"""
+testing the inventory of series saved in the warehouse
+"""
+
+import json
+import pathlib
+import tempfile
+import unittest
+from unittest import mock
+
+from edan.data.inventory import EdanInventory
+
+
+class TestEdanInventory(unittest.TestCase):
+
+	def setUp(self):
+		tmp = tempfile.TemporaryDirectory()
+		self.addCleanup(tmp.cleanup)
+		self.path = pathlib.Path(tmp.name) / 'inventory.json'
+
+	def load(self):
+		with mock.patch.object(EdanInventory, 'inventory_path', self.path):
+			inv = EdanInventory()
+		inv.inventory_path = self.path
+		return inv
+
+	def test_empty(self):
+		inv = self.load()
+		self.assertTrue(self.path.exists())
+		self.assertEqual(inv.inv_maps, {})
+
+	def test_old_format_migrated(self):
+		old = [
+			{'code': 'GDP', 'source': 'fred', 'freq': 'quarterly'},
+			{'code': 'T10101', 'source': 'bea', 'freq': 'annual'}
+		]
+		self.path.write_text(json.dumps(old))
+
+		inv = self.load()
+		self.assertEqual(inv.inv_maps, {
+			'GDP': ('fred', 'quarterly'),
+			'T10101': ('bea', 'annual')
+		})
+		self.assertIn('GDP', inv)
+		self.assertEqual(inv['T10101'], ('bea', 'annual'))
+
+		# the file is re-written in the current layout
+		self.assertEqual(json.loads(self.path.read_text()), {
+			'GDP': ['fred', 'quarterly'],
+			'T10101': ['bea', 'annual']
+		})
+
+	def test_round_trip(self):
+		self.path.write_text(json.dumps([
+			{'code': 'GDP', 'source': 'fred', 'freq': 'quarterly'}
+		]))
+
+		inv = self.load()
+		inv.add_to_inventory('UNRATE', 'fred', 'monthly')
+		inv.flush()
+
+		reloaded = self.load()
+		self.assertEqual(reloaded.inv_maps, inv.inv_maps)
+
+	def test_flush_only_when_added(self):
+		inv = self.load()
+		inv.add_to_inventory('GDP', 'fred', 'quarterly')
+		self.assertEqual(self.path.read_text(), '')
+
+		inv.flush()
+		self.assertEqual(self.load().inv_maps, {'GDP': ('fred', 'quarterly')})
+
+		with mock.patch.object(inv, 'write_updated_inventory') as write:
+			inv.flush()
+			write.assert_not_called()
+
+	def test_missing_code(self):
+		with self.assertRaises(KeyError):
+			self.load()['GDP']
+
+
+if __name__ == '__main__':
+	unittest.main()
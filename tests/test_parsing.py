@@ -0,0 +1,107 @@
+"""
+testing the compilation & evaluation of expressions of series. expected values
+are computed the way the old tree-walking evaluator did, with pandas arithmetic
+on the series themselves
+"""
+
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from edan.data.parsing import (
+	Token,
+	Var,
+	Num,
+	BinaryOp,
+	Function,
+	CodeCompiler,
+	parse_and_extract_series,
+	evaluate_expr,
+	PLUS,
+	MUL,
+	ID,
+	NUMBER,
+	FUNCTION
+)
+
+
+index = pd.date_range(end='1/1/2021', periods=6, freq='q')
+a = pd.Series([1.0, 2.0, 4.0, np.nan, 3.0, 5.0], index=index, name='a')
+b = pd.Series([2.0, 0.5, 1.0, 3.0, 4.0, 6.0], index=index, name='b')
+series = {'a': a, 'b': b}
+
+
+class TestCodeCompiler(unittest.TestCase):
+
+	def evaluate(self, expr):
+		tree, _ = parse_and_extract_series(expr)
+		return evaluate_expr(tree, series)
+
+	def assert_evaluates(self, expr, expected):
+		result = self.evaluate(expr)
+		pd.testing.assert_series_equal(result, expected, check_names=False)
+
+	def test_binary_ops(self):
+		self.assert_evaluates('a + b * 2', a + b * 2)
+		self.assert_evaluates('a - b / 4', a - b / 4)
+
+	def test_unary_ops(self):
+		self.assert_evaluates('-a + b', -a + b)
+		self.assert_evaluates('-(a - b)', -(a - b))
+		self.assert_evaluates('+a', a)
+
+	def test_power(self):
+		self.assert_evaluates('a ** 2 + b', a ** 2 + b)
+		self.assert_evaluates('2 ** a', 2 ** a)
+		self.assert_evaluates('a ** 2 ** 0.5', a ** (2 ** 0.5))
+
+	def test_in_place_temporaries(self):
+		# both operands are temporaries, so results are written into them
+		expr = '(a + b) * (a - b) / b'
+		tree, _ = parse_and_extract_series(expr)
+
+		source, _ = CodeCompiler(tree).walk()
+		self.assertIn(':=', source)
+
+		self.assert_evaluates(expr, (a + b) * (a - b) / b)
+
+	def test_inputs_unchanged(self):
+		before = {k: v.copy() for k, v in series.items()}
+		self.evaluate('-(a * b) + (a - 1) * (b + 1)')
+		for k, v in series.items():
+			with self.subTest(code=k):
+				pd.testing.assert_series_equal(v, before[k])
+
+	def test_function_call(self):
+		# log(a + 1) * b, built directly
+		tree = BinaryOp(
+			left=Function(
+				token=Token(FUNCTION, 'log'),
+				expr=BinaryOp(
+					left=Var(Token(ID, 'a')),
+					op=Token(PLUS, '+'),
+					right=Num(Token(NUMBER, 1))
+				)
+			),
+			op=Token(MUL, '*'),
+			right=Var(Token(ID, 'b'))
+		)
+		result = evaluate_expr(tree, series)
+		expected = np.log(a + 1) * b
+		pd.testing.assert_series_equal(result, expected, check_names=False)
+
+	def test_misaligned(self):
+		c = pd.Series([1.0, 2.0, 3.0], index=index[3:])
+		tree, _ = parse_and_extract_series('a * c')
+		result = evaluate_expr(tree, {'a': a, 'c': c})
+		pd.testing.assert_series_equal(result, a * c, check_names=False)
+
+	def test_numbers_only(self):
+		tree, codes = parse_and_extract_series('2 * 3 + 1')
+		self.assertEqual(codes, ())
+		self.assertEqual(evaluate_expr(tree, {}), 7.0)
+
+
+if __name__ == '__main__':
+	unittest.main()
@@ -0,0 +1,312 @@
+"""
+testing the reading & writing of series in the local data warehouse. every test
+uses its own temporary warehouse directory & inventory file
+"""
+
+import json
+import pathlib
+import tempfile
+import unittest
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+
+import edan.data.retrieve as retrieve
+from edan.core.components import Component
+from edan.core.series import Series
+from edan.data.inventory import EdanInventory
+
+
+index = pd.date_range('1/1/2020', periods=4, freq='MS').strftime('%Y-%m-%d')
+
+
+def monthly(code, values):
+	data = pd.Series(values, index=index, name=code)
+	meta = pd.Series(
+		{'source': 'fred', 'frequency': 'Monthly', 'title': code},
+		name=code
+	)
+	return data, meta
+
+
+class WarehouseTestCase(unittest.TestCase):
+
+	def setUp(self):
+		tmp = tempfile.TemporaryDirectory()
+		self.addCleanup(tmp.cleanup)
+		self.warehouse = pathlib.Path(tmp.name)
+
+		# the inventory reads & writes its file through `inventory_path`, so
+		#	it's set on the instance as well as patched during construction
+		inv_path = self.warehouse / 'inventory.json'
+		with mock.patch.object(EdanInventory, 'inventory_path', inv_path):
+			self.inventory = EdanInventory()
+		self.inventory.inventory_path = inv_path
+
+		aliases = {'fred': {'alias': 'A'}, 'bea': {}, '': {}}
+		for name, value in [
+			('warehouse', self.warehouse),
+			('inventory', self.inventory),
+			('alias_maps', aliases)
+		]:
+			patcher = mock.patch.object(retrieve, name, value)
+			patcher.start()
+			self.addCleanup(patcher.stop)
+
+		self.retriever = retrieve.EdanDataRetriever()
+
+	def saved_inventory(self):
+		return json.loads(self.inventory.inventory_path.read_text())
+
+	def save_legacy(self):
+		"""
+		store two quarterly series the way older versions did, as columns of
+		files shared by every series of the source & frequency
+		"""
+		src = self.warehouse / 'bea'
+		src.mkdir()
+
+		idx = pd.date_range('1/1/2019', periods=3, freq='QS').strftime('%Y-%m-%d')
+		pd.DataFrame(
+			{'Q1': [1.0, 2.0, 3.0], 'Q2': [4.0, np.nan, 6.0]},
+			index=idx
+		).to_parquet(src / 'quarterly.parquet')
+		pd.DataFrame(
+			{'Q1': ['bea', 'Q'], 'Q2': ['bea', 'Q']},
+			index=['source', 'frequency']
+		).to_parquet(src / 'metadata.parquet')
+
+		self.inventory.add_to_inventory('Q1', 'bea', 'quarterly')
+		self.inventory.add_to_inventory('Q2', 'bea', 'quarterly')
+
+
+class TestSeriesLayout(WarehouseTestCase):
+
+	def setUp(self):
+		super().setUp()
+		for code, values in [('A', [1.0, 2.0, np.nan, 4.0]), ('B', [5.0, 6.0, 7.0, 8.0])]:
+			self.retriever.save_fetched_info_to_warehouse(*monthly(code, values))
+
+	def test_series_paths(self):
+		data_path, meta_path = self.retriever.series_paths('A', 'fred', 'monthly')
+		self.assertEqual(data_path, self.warehouse / 'fred' / 'monthly' / 'A.parquet')
+		self.assertEqual(meta_path, self.warehouse / 'fred' / 'metadata' / 'A.parquet')
+
+		stored = sorted(
+			str(p.relative_to(self.warehouse))
+			for p in self.warehouse.rglob('*.parquet')
+		)
+		self.assertEqual(stored, [
+			'fred/metadata/A.parquet', 'fred/metadata/B.parquet',
+			'fred/monthly/A.parquet', 'fred/monthly/B.parquet'
+		])
+
+	def test_inventory_written(self):
+		self.assertEqual(
+			self.saved_inventory(),
+			{'A': ['fred', 'monthly'], 'B': ['fred', 'monthly']}
+		)
+
+	def test_retrieve(self):
+		data, meta = self.retriever.retrieve('A')
+
+		self.assertEqual(data.tolist(), [1.0, 2.0, 4.0])
+		self.assertIsInstance(data.index, pd.DatetimeIndex)
+		self.assertEqual(meta.loc['title', 'A'], 'A')
+
+	def test_retrieve_returns_copies(self):
+		data, meta = self.retriever.retrieve('A')
+		data[:] = 0.0
+		meta.loc['title'] = 'changed'
+
+		data, meta = self.retriever.retrieve('A')
+		self.assertEqual(data.tolist(), [1.0, 2.0, 4.0])
+		self.assertEqual(meta.loc['title', 'A'], 'A')
+
+	def test_resave_evicts_cache(self):
+		self.retriever.retrieve('A')
+		self.retriever.save_fetched_info_to_warehouse(*monthly('A', [9.0] * 4))
+
+		data, _ = self.retriever.retrieve('A')
+		self.assertEqual(data.tolist(), [9.0] * 4)
+
+	def test_retrieve_expression(self):
+		data, meta = self.retriever.retrieve('A + B')
+		self.assertEqual(data.tolist(), [6.0, 8.0, 12.0])
+		self.assertEqual(list(meta.columns), ['A', 'B'])
+
+	def test_batched_inventory(self):
+		with self.retriever._batched_inventory():
+			self.retriever.save_fetched_info_to_warehouse(*monthly('C', [1.0] * 4))
+			self.assertNotIn('C', self.saved_inventory())
+
+		self.assertEqual(self.saved_inventory()['C'], ['fred', 'monthly'])
+
+
+class TestLegacyLayout(WarehouseTestCase):
+
+	def setUp(self):
+		super().setUp()
+		self.save_legacy()
+
+	def test_retrieve(self):
+		data, meta = self.retriever.retrieve('Q2')
+
+		self.assertEqual(data.tolist(), [4.0, 6.0])
+		self.assertIsInstance(data.index, pd.DatetimeIndex)
+		self.assertEqual(meta.loc['source', 'Q2'], 'bea')
+
+	def test_retrieve_expression(self):
+		data, _ = self.retriever.retrieve('Q1 + Q2')
+		self.assertEqual(data.tolist(), [5.0, 9.0])
+
+
+class TestRetrieveMany(WarehouseTestCase):
+
+	def setUp(self):
+		super().setUp()
+		self.save_legacy()
+		self.retriever.save_fetched_info_to_warehouse(
+			*monthly('A', [1.0, 2.0, np.nan, 4.0])
+		)
+
+	def test_matches_retrieve(self):
+		codes = ['Q2', 'A', 'Q1', 'alias']
+		many = self.retriever.retrieve_many(codes, 'fred')
+
+		for code, (data, meta) in zip(codes, many):
+			with self.subTest(code=code):
+				d, m = self.retriever.retrieve(code, 'fred')
+				pd.testing.assert_series_equal(data, d)
+				pd.testing.assert_frame_equal(meta, m)
+
+	def test_shared_files_read_once(self):
+		with mock.patch.object(
+			self.retriever, 'load_parquet', wraps=self.retriever.load_parquet
+		) as load:
+			self.retriever.retrieve_many(['Q1', 'A', 'Q2'])
+
+		read = sorted(call.args[0].name for call in load.call_args_list)
+		self.assertEqual(read, ['metadata.parquet', 'quarterly.parquet'])
+		for call in load.call_args_list:
+			self.assertEqual(call.kwargs['columns'], ['Q1', 'Q2'])
+
+
+class RealComponent(Component):
+	mtypes = ['real']
+
+
+class TestSeriesBulk(WarehouseTestCase):
+
+	def setUp(self):
+		super().setUp()
+		self.save_legacy()
+		self.retriever.save_fetched_info_to_warehouse(
+			*monthly('A', [1.0, 2.0, np.nan, 4.0])
+		)
+
+		# `Series` retrieves with the module-level retriever
+		patcher = mock.patch('edan.core.series.retriever', self.retriever)
+		patcher.start()
+		self.addCleanup(patcher.stop)
+
+		self.comps = [
+			RealComponent('x', source='fred', real='alias'),
+			RealComponent('y', source='bea', real='Q2'),
+			RealComponent('z', source='bea'),
+			RealComponent('w', source='fred', real='alias')
+		]
+
+	def test_source_from_comps(self):
+		with mock.patch.object(
+			self.retriever, 'retrieve_many', wraps=self.retriever.retrieve_many
+		) as many:
+			series = Series.bulk(
+				['alias', 'Q2'], mtype='real', comps=self.comps[:2]
+			)
+
+		self.assertEqual(
+			sorted((c.args[0], c.kwargs['source']) for c in many.call_args_list),
+			[(['Q2'], 'bea'), (['alias'], 'fred')]
+		)
+		self.assertEqual(series[0].data.tolist(), [1.0, 2.0, 4.0])
+		self.assertEqual(series[1].data.tolist(), [4.0, 6.0])
+		self.assertIs(series[0].comp, self.comps[0])
+
+	def test_matches_init(self):
+		bulk = Series.bulk(['alias', 'Q2'], mtype='real', comps=self.comps[:2])
+		for s, comp in zip(bulk, self.comps[:2]):
+			single = Series(s.code, mtype='real', comp=comp)
+			with self.subTest(code=s.code):
+				pd.testing.assert_series_equal(s.data, single.data)
+				pd.testing.assert_frame_equal(s.meta, single.meta)
+
+	def test_repeated_codes_not_shared(self):
+		first, second = Series.bulk(['A', 'A'])
+		self.assertIsNot(first.data, second.data)
+
+	def test_load_series(self):
+		Component.load_series(self.comps, 'real')
+
+		x, y, z, w = self.comps
+		self.assertEqual(x.real.data.tolist(), [1.0, 2.0, 4.0])
+		self.assertEqual(y.real.data.tolist(), [4.0, 6.0])
+		self.assertIsNot(x.real.data, w.real.data)
+		self.assertNotIn('real', z._series_cache)
+
+		cached = x.real
+		Component.load_series(self.comps, 'real')
+		self.assertIs(x.real, cached)
+
+
+class TestTranslateAlias(WarehouseTestCase):
+
+	def test_translate(self):
+		self.assertEqual(self.retriever.translate_alias('alias', 'fred'), 'A')
+
+	def test_unknown(self):
+		self.assertEqual(self.retriever.translate_alias('other', 'fred'), 'other')
+		self.assertEqual(self.retriever.translate_alias('alias', 'bea'), 'alias')
+
+	def test_unknown_source(self):
+		self.assertEqual(self.retriever.translate_alias('alias', 'nope'), 'alias')
+		self.assertEqual(self.retriever.translate_alias('alias'), 'alias')
+
+
+class TestLoadParquetColumn(WarehouseTestCase):
+
+	def test_named_index(self):
+		df = pd.DataFrame(
+			{'x': [1.0, 2.0], 'y': [3.0, 4.0]},
+			index=pd.Index(['2020-01-01', '2020-02-01'], name='date')
+		)
+		path = self.warehouse / 'named.parquet'
+		df.to_parquet(path)
+
+		col = self.retriever.load_parquet_column(path, 'y')
+		pd.testing.assert_series_equal(col, df['y'])
+
+	def test_unnamed_index(self):
+		df = pd.DataFrame({'x': ['bea', 'Q']}, index=['source', 'frequency'])
+		path = self.warehouse / 'unnamed.parquet'
+		df.to_parquet(path)
+
+		col = self.retriever.load_parquet_column(str(path), 'x')
+		pd.testing.assert_series_equal(col, df['x'])
+
+	def test_range_index(self):
+		df = pd.DataFrame({'x': [1.0, 2.0, 3.0]})
+		path = self.warehouse / 'range.parquet'
+		df.to_parquet(path)
+
+		col = self.retriever.load_parquet_column(path, 'x')
+		pd.testing.assert_series_equal(col, df['x'])
+
+	def test_missing_file(self):
+		path = self.warehouse / 'missing.parquet'
+		self.assertIsNone(self.retriever.load_parquet_column(path, 'x'))
+
+
+if __name__ == '__main__':
+	unittest.main()
@@ -0,0 +1,122 @@
+"""
+testing the indexing & printing of Tables
+"""
+
+import unittest
+from unittest import mock
+
+from edan.algos import construct_forest
+from edan.core.components import Component
+from edan.core.tables import Table, TablePrettyPrinter
+
+
+class MeasuredComponent(Component):
+	mtypes = ['real']
+
+
+entries = [
+	{
+		'code': 'a', '__level__': 0, 'long_name': 'aggregate', 'short_name': '',
+		'source': 'bea', '__table__': 't1', 'real': 'ra'
+	},
+	{
+		'code': 'a:b', '__level__': 1, 'long_name': 'sub', 'short_name': '',
+		'source': 'bea', '__table__': 't1', 'real': 'rb'
+	},
+	{
+		'code': 'a:b:d', '__level__': 2, 'long_name': 'subsub', 'short_name': '',
+		'source': 'bea', '__table__': 't1', 'real': 'rd'
+	},
+	{
+		'code': 'a~c', '__level__': 1, 'long_name': 'less', 'short_name': '',
+		'source': 'bea', '__table__': 't1', 'real': 'rc'
+	}
+]
+
+
+class TestTable(unittest.TestCase):
+
+	def setUp(self):
+		self.comps = MeasuredComponent.from_registry_many(entries)
+		construct_forest(self.comps, level='level', lower='subs')
+		self.table = Table([self.comps[0]], 'T')
+
+	def test_order(self):
+		self.assertEqual(list(self.table), ['a', 'a:b', 'a:b:d', 'a~c'])
+		self.assertEqual(len(self.table), 4)
+
+	def test_getitem_code(self):
+		for comp in self.comps:
+			with self.subTest(code=comp.code):
+				self.assertIs(self.table[comp.code], comp)
+
+		with self.assertRaises(KeyError):
+			self.table['z']
+
+	def test_getitem_int(self):
+		for i, comp in enumerate(self.comps):
+			with self.subTest(pos=i):
+				self.assertIs(self.table[i], comp)
+
+		self.assertIs(self.table[-1], self.comps[-1])
+		with self.assertRaises(IndexError):
+			self.table[4]
+
+	def test_getitem_slice(self):
+		self.assertEqual(self.table[1:3], tuple(self.comps[1:3]))
+		self.assertEqual(self.table['a:b':'a~c'], tuple(self.comps[1:3]))
+		self.assertEqual(self.table[0:'a~c'], tuple(self.comps[:3]))
+
+		with self.assertRaises(KeyError):
+			self.table['a':'z']
+		with self.assertRaises(IndexError):
+			self.table[2:6]
+
+	def test_getitem_iterable(self):
+		self.assertEqual(
+			self.table[['a~c', 0, 'a:b']],
+			(self.comps[3], self.comps[0], self.comps[1])
+		)
+
+	def test_getitem_bad_type(self):
+		with self.assertRaises(TypeError):
+			self.table[1.0]
+
+	def test_rows_read_only(self):
+		rows = self.table.rows
+		self.assertIs(rows['a:b'], self.comps[1])
+
+		with self.assertRaises(TypeError):
+			rows['z'] = self.comps[0]
+		with self.assertRaises(TypeError):
+			del rows['a']
+		self.assertEqual(len(self.table), 4)
+
+	def test_str_cached(self):
+		with mock.patch.object(
+			TablePrettyPrinter, 'get_console_config', return_value=(40, 20)
+		):
+			first = str(self.table)
+			self.assertIs(str(self.table), first)
+			self.assertIn(40, self.table._rendered)
+
+			with mock.patch.object(TablePrettyPrinter, 'print') as render:
+				str(self.table)
+				render.assert_not_called()
+
+		self.assertTrue(first.startswith('T Table\n'))
+		self.assertIn('subsub', first)
+
+	def test_str_width_change(self):
+		config = 'get_console_config'
+		with mock.patch.object(TablePrettyPrinter, config, return_value=(40, 20)):
+			wide = str(self.table)
+		with mock.patch.object(TablePrettyPrinter, config, return_value=(12, 20)):
+			narrow = str(self.table)
+
+		self.assertNotEqual(wide, narrow)
+		self.assertEqual(set(self.table._rendered), {40, 12})
+
+
+if __name__ == '__main__':
+	unittest.main()
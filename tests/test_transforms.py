@@ -6,8 +6,9 @@ need to rename this module
 """
 
 import unittest
+import warnings
 
-from edan.aggregates.transformations import TransformationAccessor
+from edan.core.transformations import TransformationAccessor
 
 import pandas as pd
 import numpy as np
@@ -171,6 +172,14 @@ class TestTransformationAccessor(unittest.TestCase):
 		diff[n:] = (100/n) * np.log(test_arr[n:] / test_arr[:-n])
 		self.assertIsNone(aequal(diff, test_transform('difvl', n=n).values))
 
+	def test_difvl_monotone(self):
+		# regression test: `difvl` once divided by the `shift` method itself
+		n = 2
+		monotone = DataWrapper(test_data.cumsum() + 1)
+		difvl = TransformationAccessor(monotone)('difvl', n=n).values
+		self.assertTrue(np.isnan(difvl[:n]).all())
+		self.assertTrue(np.isfinite(difvl[n:]).all())
+
 	def test_movv_n(self):
 		# using `aequal` throws errors b/c of differences on the order of 1.5e-16
 		n = 3
@@ -195,6 +204,38 @@ class TestTransformationAccessor(unittest.TestCase):
 			movv[i] = np.sum(test_arr[i-n+1:i+1])
 		self.assertIsNone(approx_equal(movv, test_transform('movt', n=n).values))
 
+	def test_movt_mixed_magnitude(self):
+		# windows of small values that follow very large ones shouldn't lose
+		#	precision to the large values that have already left the window
+		n = 3
+		data = pd.Series(
+			data=[1e9, 2e9, 3e9, 1.994, 2.0, 1.988, 0.01, 0.02, np.nan, 0.03],
+			index=pd.date_range(end='1/1/2021', periods=10, freq='q')
+		)
+		movt = TransformationAccessor(DataWrapper(data))('movt', n=n).values
+		expected = data.rolling(n).sum().values
+		self.assertIsNone(np.testing.assert_allclose(movt, expected, rtol=1e-12))
+
+	def test_zeros_no_warning(self):
+		# zeros & sign changes give inf & NaN without warnings, like pandas
+		data = pd.Series(
+			data=[0.0, 2.0, 0.0, 3.0, -1.0, np.nan],
+			index=pd.date_range(end='1/1/2021', periods=6, freq='q')
+		)
+		transform = TransformationAccessor(DataWrapper(data))
+
+		for method in ['diff%', 'diffl', 'difa%', 'difal', 'yryr%', 'yryrl']:
+			with self.subTest(method=method):
+				with warnings.catch_warnings():
+					warnings.simplefilter('error')
+					transform(method, n=1)
+
+		with warnings.catch_warnings():
+			warnings.simplefilter('error')
+			pct = transform('diff%').values
+		expected = 100 * (data / data.shift(1) - 1)
+		self.assertIsNone(aequal(pct, expected.values))
+
 	def test_yryr(self):
 		yryr = self.new_blank()
 		yryr[4:] = test_arr[4:] - test_arr[:-4]